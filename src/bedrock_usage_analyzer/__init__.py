@@ -3,7 +3,16 @@
 
 """Bedrock Usage Analyzer - Token usage statistics for Amazon Bedrock"""
 
-from importlib.metadata import version
-
-__version__ = version("bedrock-usage-analyzer")
 __all__ = ["__version__"]
+
+
+def __getattr__(name):
+    """Resolve __version__ on first access
+    
+    importlib.metadata is slow to import and scans installed distributions,
+    which every CLI start would otherwise pay for through this package.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+        return version("bedrock-usage-analyzer")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
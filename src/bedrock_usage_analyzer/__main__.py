@@ -8,14 +8,6 @@ import logging
 import traceback
 import argparse
 
-from bedrock_usage_analyzer.utils.paths import (
-    get_metadata_location_message,
-    get_refresh_location_message,
-    get_writable_path,
-    get_bundle_path,
-    get_data_path,
-)
-
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
@@ -79,6 +71,7 @@ def _parse_granularity(granularity_arg):
 
 def cmd_analyze(args):
     """Run usage analysis."""
+    from bedrock_usage_analyzer.utils.paths import get_metadata_location_message
     from bedrock_usage_analyzer.core.user_inputs import UserInputs
     from bedrock_usage_analyzer.core.analyzer import BedrockAnalyzer
     
@@ -113,6 +106,7 @@ def cmd_analyze(args):
 
 def cmd_refresh_regions(args):
     """Refresh regions list."""
+    from bedrock_usage_analyzer.utils.paths import get_refresh_location_message, get_writable_path
     from bedrock_usage_analyzer.sync.regions import refresh_regions
     from bedrock_usage_analyzer.utils.yaml_handler import save_yaml
     
@@ -129,6 +123,7 @@ def cmd_refresh_regions(args):
 
 def cmd_refresh_fm_list(args):
     """Refresh FM lists."""
+    from bedrock_usage_analyzer.utils.paths import get_refresh_location_message, get_data_path
     from bedrock_usage_analyzer.sync.fm_list import refresh_region, refresh_all_regions
     from bedrock_usage_analyzer.utils.yaml_handler import load_yaml
     
@@ -160,6 +155,7 @@ def cmd_refresh_fm_list(args):
 
 def cmd_refresh_fm_quotas(args):
     """Refresh quota mappings."""
+    from bedrock_usage_analyzer.utils.paths import get_refresh_location_message
     from bedrock_usage_analyzer.sync.quota_mapper import QuotaMapper
     from bedrock_usage_analyzer.utils.ui import select_quota_mapping_params
     
@@ -186,6 +182,7 @@ def cmd_refresh_fm_quotas(args):
 
 def cmd_refresh_quota_index(args):
     """Generate quota index CSV."""
+    from bedrock_usage_analyzer.utils.paths import get_refresh_location_message
     from bedrock_usage_analyzer.sync.quota_index import QuotaIndexGenerator
     
     print(get_refresh_location_message())
@@ -202,6 +199,7 @@ def _maybe_update_bundle(args, filename, data):
     if not getattr(args, 'update_bundle', False):
         return
     
+    from bedrock_usage_analyzer.utils.paths import get_bundle_path
     from bedrock_usage_analyzer.utils.yaml_handler import save_yaml
     
     bundle_path = get_bundle_path()
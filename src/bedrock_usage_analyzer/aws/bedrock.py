@@ -3,12 +3,15 @@
 
 """AWS Bedrock service operations"""
 
-import boto3
 import sys
 import os
 import logging
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Optional
+from botocore.exceptions import ClientError
 from bedrock_usage_analyzer.utils.partition import build_arn
+from bedrock_usage_analyzer.aws.clients import get_client, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,13 @@ QUOTA_KEYWORD_ON_DEMAND = 'on-demand'
 QUOTA_KEYWORD_CROSS_REGION = 'cross-region'
 QUOTA_KEYWORD_GLOBAL = 'global'
 
+# Separates the model ID in foundation model ARNs
+_FOUNDATION_MODEL_ARN_MARKER = ':foundation-model/'
+
+# Errors meaning the account can't use Bedrock in a region (skipped rather than reported as failures)
+_ACCESS_DENIED_ERROR_CODES = frozenset({'AccessDeniedException', 'UnauthorizedOperation', 'SubscriptionRequiredException'})
+_ACCESS_DENIED_MESSAGES = ('AccessDenied', 'UnauthorizedOperation', 'not enabled', 'not subscribed')
+
 # Cache for prefix mapping to avoid repeated file reads
 _prefix_mapping_cache = None
 
@@ -52,9 +62,44 @@ def _load_prefix_mapping() -> List[Dict]:
         )
 
 
+@lru_cache(maxsize=4096)
+def get_arn_region_prefix(arn: str) -> str:
+    """Get the region prefix of an ARN
+    
+    Model ARNs repeat across profiles, so results are cached.
+    
+    Args:
+        arn: ARN such as arn:aws:bedrock:us-east-1::foundation-model/model-id
+        
+    Returns:
+        Region prefix (e.g., 'us' for us-east-1, 'ap' for ap-northeast-1)
+    """
+    return arn.split(':', 4)[3].split('-', 1)[0]
+
+
+def get_single_region_prefix(arns: List[str]) -> Optional[str]:
+    """Get the region prefix shared by all ARNs
+    
+    Stops at the first ARN with a different prefix.
+    
+    Args:
+        arns: Non-empty list of ARNs
+        
+    Returns:
+        The common region prefix, or None if the ARNs span multiple prefixes
+    """
+    arns_iter = iter(arns)
+    prefix = get_arn_region_prefix(next(arns_iter))
+    return prefix if all(get_arn_region_prefix(arn) == prefix for arn in arns_iter) else None
+
+
+@lru_cache(maxsize=1)
 def get_endpoint_quota_keywords() -> Dict[str, str]:
     """Get mapping of endpoint prefix to quota keyword
     
+    Like the other prefix-mapping views below, it is derived once from the
+    process-wide mapping and shared between callers, so it must not be mutated.
+    
     Returns:
         Dict mapping prefix to quota keyword (e.g., {'base': 'on-demand', 'us': 'cross-region'})
     """
@@ -62,6 +107,7 @@ def get_endpoint_quota_keywords() -> Dict[str, str]:
     return {m['prefix']: m['quota_keyword'] for m in mapping}
 
 
+@lru_cache(maxsize=1)
 def get_endpoint_descriptions() -> Dict[str, str]:
     """Get mapping of endpoint prefix to description
     
@@ -72,6 +118,7 @@ def get_endpoint_descriptions() -> Dict[str, str]:
     return {m['prefix']: m['description'] for m in mapping}
 
 
+@lru_cache(maxsize=1)
 def get_regional_profile_prefixes() -> List[str]:
     """Get list of regional profile prefixes
     
@@ -82,6 +129,7 @@ def get_regional_profile_prefixes() -> List[str]:
     return [m['prefix'] for m in mapping if m['is_regional']]
 
 
+@lru_cache(maxsize=1)
 def get_default_region_prefix_map() -> Dict[str, str]:
     """Get mapping of region prefix to system profile prefix
     
@@ -94,7 +142,7 @@ def get_default_region_prefix_map() -> Dict[str, str]:
     return result
 
 
-def discover_prefix_mapping(region: str) -> List[Dict]:
+def discover_prefix_mapping(region: str, all_profiles: Optional[List[Dict]] = None) -> List[Dict]:
     """Discover system profile prefixes from Bedrock API
     
     Discovers regional inference profile prefixes (us, eu, jp, au, apac, ca, etc.)
@@ -103,6 +151,8 @@ def discover_prefix_mapping(region: str) -> List[Dict]:
     
     Args:
         region: AWS region to use for API calls
+        all_profiles: Already-fetched inference profiles (e.g. from fetch_all_inference_profiles);
+                      streamed from the API when not provided
         
     Returns:
         List of discovered prefix mappings with structure:
@@ -118,50 +168,43 @@ def discover_prefix_mapping(region: str) -> List[Dict]:
         ]
     """
     try:
-        bedrock = boto3.client('bedrock', region_name=region)
-        response = bedrock.list_inference_profiles(maxResults=1000)
-        
-        # Collect all profiles with pagination
-        all_profiles = []
-        while True:
-            all_profiles.extend(response['inferenceProfileSummaries'])
-            if 'nextToken' in response:
-                response = bedrock.list_inference_profiles(
-                    maxResults=1000,
-                    nextToken=response['nextToken']
-                )
-            else:
-                break
+        if all_profiles is None:
+            # Stream the profiles page by page instead of collecting them all first
+            all_profiles = paginate(
+                get_client('bedrock', region), 'list_inference_profiles', 'inferenceProfileSummaries',
+                PaginationConfig={'PageSize': 1000}
+            )
         
         # Extract system profile prefixes
         discovered = []
         seen_prefixes = set()
         
         for profile in all_profiles:
-            if profile['type'] == 'SYSTEM_DEFINED' and '.' in profile['inferenceProfileId']:
-                system_prefix = profile['inferenceProfileId'].split('.')[0]
-                
-                # Skip if already processed or if it's 'global'
-                if system_prefix in seen_prefixes or system_prefix == 'global':
-                    continue
-                
-                model_arns = [m['modelArn'] for m in profile['models']]
-                
-                # Classify as regional if multiple ARNs in same region prefix
-                if len(model_arns) > 1:
-                    regions = [arn.split(':')[3] for arn in model_arns]
-                    region_prefixes = set(r.split('-')[0] for r in regions)
-                    
-                    # Regional: all ARNs in same region prefix (us-*, eu-*, etc.)
-                    if len(region_prefixes) == 1:
-                        discovered.append({
-                            'prefix': system_prefix,
-                            'quota_keyword': QUOTA_KEYWORD_CROSS_REGION,
-                            'description': 'cross-region inference profile',
-                            'is_regional': True,
-                            'source': 'discovered'
-                        })
-                        seen_prefixes.add(system_prefix)
+            profile_id = profile['inferenceProfileId']
+            if profile['type'] != 'SYSTEM_DEFINED' or '.' not in profile_id:
+                continue
+            
+            system_prefix = profile_id.split('.', 1)[0]
+            
+            # Skip if already processed or if it's 'global'
+            if system_prefix in seen_prefixes or system_prefix == 'global':
+                continue
+            
+            # Classify as regional if multiple ARNs in same region prefix
+            models = profile['models']
+            if len(models) < 2:
+                continue
+            
+            # Regional: all ARNs in same region prefix (us-*, eu-*, etc.)
+            if get_single_region_prefix([m['modelArn'] for m in models]) is not None:
+                discovered.append({
+                    'prefix': system_prefix,
+                    'quota_keyword': QUOTA_KEYWORD_CROSS_REGION,
+                    'description': 'cross-region inference profile',
+                    'is_regional': True,
+                    'source': 'discovered'
+                })
+                seen_prefixes.add(system_prefix)
         
         logger.info(f"Discovered {len(discovered)} regional prefixes: {[d['prefix'] for d in discovered]}")
         return discovered
@@ -171,6 +214,22 @@ def discover_prefix_mapping(region: str) -> List[Dict]:
         return []
 
 
+def _is_access_denied(error: Exception) -> bool:
+    """Check whether an error means Bedrock is not accessible or not enabled in the region
+    
+    Args:
+        error: Exception raised by a Bedrock API call
+        
+    Returns:
+        True for access-denied / not-enabled errors
+    """
+    # Typed error code first; the message check covers errors without a matching code
+    if isinstance(error, ClientError) and error.response.get('Error', {}).get('Code') in _ACCESS_DENIED_ERROR_CODES:
+        return True
+    error_msg = str(error)
+    return any(x in error_msg for x in _ACCESS_DENIED_MESSAGES)
+
+
 def fetch_foundation_models(region: str) -> Optional[List[Dict]]:
     """Fetch foundation models for a region
     
@@ -181,7 +240,7 @@ def fetch_foundation_models(region: str) -> Optional[List[Dict]]:
         List of model dictionaries or None if access denied
     """
     try:
-        bedrock = boto3.client('bedrock', region_name=region)
+        bedrock = get_client('bedrock', region)
         response = bedrock.list_foundation_models()
         
         models = []
@@ -195,11 +254,11 @@ def fetch_foundation_models(region: str) -> Optional[List[Dict]]:
         return models
     
     except Exception as e:
-        error_msg = str(e)
-        if any(x in error_msg for x in ['AccessDenied', 'UnauthorizedOperation', 'not enabled', 'not subscribed']):
-            print(f"  ⊘ Skipping {region} (access denied or not enabled)", file=sys.stderr)
+        if _is_access_denied(e):
+            # Expected for regions the account hasn't enabled; the caller reports skipped regions
+            logger.debug(f"Skipping {region} (access denied or not enabled): {e}")
         else:
-            print(f"  ✗ Failed to fetch models for {region}: {e}", file=sys.stderr)
+            logger.warning(f"  ✗ Failed to fetch models for {region}: {e}")
         return None
 
 
@@ -215,16 +274,8 @@ def fetch_all_inference_profiles(region: str) -> List[Dict]:
         List of inference profile dictionaries
     """
     try:
-        bedrock = boto3.client('bedrock', region_name=region)
-        
         # Use paginator to handle large result sets
-        paginator = bedrock.get_paginator('list_inference_profiles')
-        all_profiles = []
-        
-        for page in paginator.paginate():
-            all_profiles.extend(page.get('inferenceProfileSummaries', []))
-        
-        return all_profiles
+        return list(paginate(get_client('bedrock', region), 'list_inference_profiles', 'inferenceProfileSummaries'))
     
     except Exception as e:
         # Inference profiles might not be available in all regions
@@ -241,7 +292,7 @@ def build_profile_map(profiles: List[Dict]) -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping model IDs to list of profile prefixes
     """
-    profile_map = {}
+    profile_map = defaultdict(set)
     
     for profile in profiles:
         profile_id = profile.get('inferenceProfileId', '')
@@ -255,59 +306,69 @@ def build_profile_map(profiles: List[Dict]) -> Dict[str, List[str]]:
         for model in profile.get('models', []):
             model_arn = model.get('modelArn', '')
             
-            # Extract model_id from ARN (format: arn:aws:bedrock:region::foundation-model/model-id)
-            if ':foundation-model/' in model_arn:
-                model_id = model_arn.split(':foundation-model/')[-1]
-                
-                if model_id not in profile_map:
-                    profile_map[model_id] = []
-                if prefix not in profile_map[model_id]:
-                    profile_map[model_id].append(prefix)
+            # Extract model_id from ARN (format: arn:aws:bedrock:region::foundation-model/model-id),
+            # finding and splitting at the marker in one pass
+            _, marker, model_id = model_arn.partition(_FOUNDATION_MODEL_ARN_MARKER)
+            if marker:
+                # Set semantics: a repeated prefix is absorbed without scanning the model's prefixes
+                profile_map[model_id].add(prefix)
     
     # Sort prefixes for consistency
-    for model_id in profile_map:
-        profile_map[model_id] = sorted(profile_map[model_id])
+    return {model_id: sorted(prefixes) for model_id, prefixes in profile_map.items()}
+
+
+def build_profile_arn_map(bedrock_client) -> Dict[str, str]:
+    """Build mapping: inference profile ID → ARN from one listing of the profiles
     
-    return profile_map
+    Callers resolving several profiles build this once and pass it to
+    get_inference_profile_arn / create_application_inference_profile.
+    
+    Args:
+        bedrock_client: Boto3 Bedrock client
+        
+    Returns:
+        Dictionary mapping inference profile IDs (e.g. 'us.<model_id>') to their ARNs
+    """
+    profiles = paginate(
+        bedrock_client, 'list_inference_profiles', 'inferenceProfileSummaries',
+        PaginationConfig={'PageSize': 1000}
+    )
+    return {profile['inferenceProfileId']: profile['inferenceProfileArn'] for profile in profiles}
 
 
-def get_inference_profile_arn(bedrock_client, model_id: str, profile_prefix: str) -> Optional[str]:
+def get_inference_profile_arn(bedrock_client, model_id: str, profile_prefix: str,
+                              profile_arn_map: Optional[Dict[str, str]] = None) -> Optional[str]:
     """Get the ARN of a system-defined inference profile
     
     Args:
         bedrock_client: Boto3 Bedrock client
         model_id: Model ID
         profile_prefix: Profile prefix (us, eu, etc.)
+        profile_arn_map: Optional map from build_profile_arn_map for batch callers; without
+            it the profile listing is scanned until the first match
         
     Returns:
         Profile ARN or None if not found
     """
+    profile_id = f"{profile_prefix}.{model_id}"
     try:
-        target_profile_id = f"{profile_prefix}.{model_id}"
-        next_token = None
-        
-        while True:
-            params = {'maxResults': 1000}
-            if next_token:
-                params['nextToken'] = next_token
-            
-            response = bedrock_client.list_inference_profiles(**params)
-            
-            for profile in response.get('inferenceProfileSummaries', []):
-                if profile.get('inferenceProfileId') == target_profile_id:
-                    return profile.get('inferenceProfileArn')
-            
-            next_token = response.get('nextToken')
-            if not next_token:
-                break
-        
+        if profile_arn_map is not None:
+            return profile_arn_map.get(profile_id)
+        profiles = paginate(
+            bedrock_client, 'list_inference_profiles', 'inferenceProfileSummaries',
+            PaginationConfig={'PageSize': 1000}
+        )
+        for profile in profiles:
+            if profile.get('inferenceProfileId') == profile_id:
+                return profile.get('inferenceProfileArn')
         return None
     except Exception as e:
         print(f"Error fetching inference profile: {e}", file=sys.stderr)
         return None
 
 
-def create_application_inference_profile(bedrock_client, model_id: str, profile_prefix: Optional[str], region: str, profile_name: str) -> Optional[str]:
+def create_application_inference_profile(bedrock_client, model_id: str, profile_prefix: Optional[str], region: str, profile_name: str,
+                                         profile_arn_map: Optional[Dict[str, str]] = None) -> Optional[str]:
     """Create an application inference profile
     
     Args:
@@ -316,6 +377,7 @@ def create_application_inference_profile(bedrock_client, model_id: str, profile_
         profile_prefix: Profile prefix or None for base model
         region: AWS region
         profile_name: Name for the application profile
+        profile_arn_map: Map from build_profile_arn_map, to reuse one listing across calls
         
     Returns:
         Profile ARN or None if creation failed
@@ -323,7 +385,7 @@ def create_application_inference_profile(bedrock_client, model_id: str, profile_
     try:
         # Determine source ARN
         if profile_prefix and profile_prefix != 'null':
-            source_arn = get_inference_profile_arn(bedrock_client, model_id, profile_prefix)
+            source_arn = get_inference_profile_arn(bedrock_client, model_id, profile_prefix, profile_arn_map)
             if not source_arn:
                 print(f"Could not find system profile for {profile_prefix}.{model_id}", file=sys.stderr)
                 return None
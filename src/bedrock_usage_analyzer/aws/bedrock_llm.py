@@ -3,11 +3,43 @@
 
 """Bedrock LLM invocation for intelligent quota mapping"""
 
-import boto3
+import re
 import sys
 from typing import Optional, Dict, List
 
 from bedrock_usage_analyzer.aws.bedrock import get_endpoint_descriptions
+from bedrock_usage_analyzer.aws.clients import get_client
+
+# [profile prefix.]vendor.family-..., where the family is purely alphabetic (e.g. 'claude', 'nova')
+_FAMILY_NAME_PATTERN = re.compile(r'^(?:[a-z]+\.)?[a-z0-9-]+\.([a-z]+)(?=[-:]|$)')
+
+# Families whose name appears as-is in Service Quotas names, so it is safe as the substring filter
+# in QuotaMapper._find_matching_quotas. Product-line words ('embed', 'stable', 'rerank', 'ray',
+# 'gpt') are left to the LLM, as they would match unrelated quotas or none at all.
+_QUOTA_NAME_FAMILIES = frozenset({
+    'claude', 'nova', 'titan', 'mistral', 'mixtral', 'pixtral', 'ministral', 'magistral',
+    'voxtral', 'jamba', 'command', 'gemma', 'nemotron', 'palmyra', 'marengo', 'pegasus',
+    'kimi', 'minimax',
+})
+
+
+def _try_local_common_name(fm_model_id: str) -> Optional[str]:
+    """Derive the common model name from a well-formed model ID without calling the LLM
+    
+    Only families listed in _QUOTA_NAME_FAMILIES are resolved. Families with digits in
+    their name (e.g. 'llama3-2', 'qwen3') don't match, since the family name used in
+    quota names isn't derivable from them ('Llama 3.2').
+    
+    Args:
+        fm_model_id: Foundation model ID (e.g., 'anthropic.claude-3-5-sonnet-20241022-v2:0')
+        
+    Returns:
+        Common name (e.g., 'claude') or None if it can't be derived locally
+    """
+    match = _FAMILY_NAME_PATTERN.match(fm_model_id)
+    if match and match.group(1) in _QUOTA_NAME_FAMILIES:
+        return match.group(1)
+    return None
 
 
 def extract_common_name(region: str, model_id: str, fm_model_id: str) -> Optional[str]:
@@ -15,6 +47,7 @@ def extract_common_name(region: str, model_id: str, fm_model_id: str) -> Optiona
     This method is used in quotas mapping (mapping FM usage metric e.g. RPM to the correct quota in AWS Service Quotas)
     This instructs LLM to extract a common name of an FM. For example, 'nova-lite' becomes 'nova'
     The technique is used to form keyword search to narrow down the list of FMs to be fed into the LLM call for the actual mapping, while avoiding false negatives of being too specific
+    Model IDs of the usual vendor.family-variant shape are resolved locally, without the LLM call.
     
     Args:
         region: AWS region for Bedrock
@@ -24,7 +57,11 @@ def extract_common_name(region: str, model_id: str, fm_model_id: str) -> Optiona
     Returns:
         Common name or None
     """
-    client = boto3.client('bedrock-runtime', region_name=region)
+    common_name = _try_local_common_name(fm_model_id)
+    if common_name:
+        return common_name
+    
+    client = get_client('bedrock-runtime', region)
     
     # Use tool to enforce JSON format
     tool_config = {
@@ -94,7 +131,7 @@ def extract_quota_codes(region: str, model_id: str, fm_model_id: str,
     Returns:
         Dict with tpm/rpm/tpd/concurrent, each containing {code, name} or None
     """
-    client = boto3.client('bedrock-runtime', region_name=region)
+    client = get_client('bedrock-runtime', region)
     
     tool_config = {
         'tools': [{
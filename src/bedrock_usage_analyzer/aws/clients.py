@@ -0,0 +1,89 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared concurrency and connection settings for boto3 clients"""
+
+import os
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_ENV_VAR = "BEDROCK_ANALYZER_CONCURRENCY"
+
+# boto3's default session isn't safe to create clients from concurrently
+_client_lock = threading.Lock()
+
+
+def get_max_workers() -> int:
+    """Get the worker count for concurrent AWS calls (env var or I/O-sized default)
+    
+    AWS calls are network-bound, so the default is a multiple of the CPU count
+    rather than the CPU count itself.
+    
+    Returns:
+        Number of worker threads to use
+    """
+    if value := os.environ.get(CONCURRENCY_ENV_VAR):
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid {CONCURRENCY_ENV_VAR}={value!r}")
+    return min(64, 4 * (os.cpu_count() or 4))
+
+
+def get_client_config() -> Config:
+    """Get botocore config with a connection pool sized for get_max_workers()
+    
+    Returns:
+        Config with matching max_pool_connections and adaptive retries
+    """
+    return Config(
+        max_pool_connections=get_max_workers(),
+        retries={'mode': 'adaptive', 'max_attempts': 10}
+    )
+
+
+@lru_cache(maxsize=None)
+def _create_client(service: str, region: Optional[str]):
+    """Create the client behind get_client (called under _client_lock)"""
+    return boto3.client(service, region_name=region, config=get_client_config())
+
+
+def get_client(service: str, region: Optional[str] = None):
+    """Get a shared boto3 client, created once per (service, region)
+    
+    Client construction loads botocore's service models, so helpers called per
+    region or per model reuse one client instead. Clients are safe to share
+    across threads once created.
+    
+    Args:
+        service: AWS service name (e.g., 'bedrock', 'service-quotas')
+        region: AWS region name, or None for the default region
+        
+    Returns:
+        Boto3 client configured with get_client_config()
+    """
+    with _client_lock:
+        return _create_client(service, region)
+
+
+def paginate(client, operation: str, result_key: str, **kwargs) -> Iterator[Dict]:
+    """Stream the items of a paginated API call, one page at a time
+    
+    Args:
+        client: Boto3 client
+        operation: Paginated operation name (e.g., 'list_inference_profiles')
+        result_key: Key holding each page's items (e.g., 'inferenceProfileSummaries')
+        **kwargs: Operation parameters, plus an optional PaginationConfig
+        
+    Yields:
+        Individual items across all pages
+    """
+    for page in client.get_paginator(operation).paginate(**kwargs):
+        yield from page.get(result_key, [])
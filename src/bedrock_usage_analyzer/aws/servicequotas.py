@@ -3,10 +3,11 @@
 
 """AWS Service Quotas operations"""
 
-import boto3
 import sys
 from typing import List, Dict, Optional
 
+from bedrock_usage_analyzer.aws.clients import get_client, paginate
+
 
 def fetch_service_quotas(region: str, service_code: str = 'bedrock') -> List[Dict]:
     """Fetch all service quotas for Bedrock
@@ -19,14 +20,8 @@ def fetch_service_quotas(region: str, service_code: str = 'bedrock') -> List[Dic
         List of quota dictionaries
     """
     try:
-        client = boto3.client('service-quotas', region_name=region)
-        quotas = []
-        
-        paginator = client.get_paginator('list_service_quotas')
-        for page in paginator.paginate(ServiceCode=service_code):
-            quotas.extend(page.get('Quotas', []))
-        
-        return quotas
+        client = get_client('service-quotas', region)
+        return list(paginate(client, 'list_service_quotas', 'Quotas', ServiceCode=service_code))
     except Exception as e:
         print(f"Error fetching quotas for {region}: {e}", file=sys.stderr)
         return []
@@ -44,7 +39,7 @@ def get_quota_details(quota_code: str, region: str, service_code: str = 'bedrock
         Quota details dictionary or None if not found
     """
     try:
-        client = boto3.client('service-quotas', region_name=region)
+        client = get_client('service-quotas', region)
         response = client.get_service_quota(
             ServiceCode=service_code,
             QuotaCode=quota_code
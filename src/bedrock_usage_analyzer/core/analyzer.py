@@ -6,26 +6,46 @@
 import boto3
 import numpy as np
 import logging
-import traceback
 import os
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 from bedrock_usage_analyzer.core.user_inputs import UserInputs
 from bedrock_usage_analyzer.core.profile_fetcher import InferenceProfileFetcher
 from bedrock_usage_analyzer.core.metrics_fetcher import CloudWatchMetricsFetcher
 from bedrock_usage_analyzer.core.output_generator import OutputGenerator
 from bedrock_usage_analyzer.aws.bedrock import get_regional_profile_prefixes
+from bedrock_usage_analyzer.aws.clients import get_client_config, get_max_workers
 from bedrock_usage_analyzer.utils.paths import get_data_path
+from bedrock_usage_analyzer.utils.yaml_handler import load_yaml
 from bedrock_usage_analyzer.utils.partition import get_service_quota_url
 
 logger = logging.getLogger(__name__)
 
+# Read-only stand-in for a metric with no statistics (avoids a throwaway dict per lookup)
+_NO_STATS = {}
+
+
+class _ModelLogAdapter(logging.LoggerAdapter):
+    """Tag log lines with their model ID, so concurrently processed models stay distinguishable"""
+    
+    def process(self, msg, kwargs):
+        # Keep leading blank lines and indentation in front of the tag
+        body = msg.lstrip('\n')
+        text = body.lstrip(' ')
+        prefix = msg[:len(msg) - len(text)]
+        return f"{prefix}[{self.extra['model_id']}] {text}", kwargs
+
+
 class BedrockAnalyzer:
     """Main orchestrator for Bedrock token usage analysis"""
     
     TIME_PERIODS = ["1hour", "1day", "7days", "14days", "30days"]
     
+    # Models processed concurrently; they split the get_max_workers() budget for their AWS calls
+    MAX_PARALLEL_MODELS = 4
+    
     def __init__(self, region, granularity_config):
         self.region = region
         self.granularity_config = granularity_config
@@ -37,13 +57,44 @@ class BedrockAnalyzer:
         self.tz_offset = f"{offset[:3]}:{offset[3:]}"  # +08:00 format
         self.tz_api_format = offset[:5]  # +0800 format for API
         
-        # Initialize clients
-        self.bedrock_client = boto3.client('bedrock', region_name=region)
-        self.cloudwatch_client = boto3.client('cloudwatch', region_name=region)
-        self.sq_client = boto3.client('service-quotas', region_name=region)
+        # Initialize clients (connection pools sized for concurrent calls)
+        client_config = get_client_config()
+        self.bedrock_client = boto3.client('bedrock', region_name=region, config=client_config)
+        self.cloudwatch_client = boto3.client('cloudwatch', region_name=region, config=client_config)
+        self.sq_client = boto3.client('service-quotas', region_name=region, config=client_config)
         self.profile_fetcher = InferenceProfileFetcher(self.bedrock_client)
-        self.metrics_fetcher = CloudWatchMetricsFetcher(self.cloudwatch_client, self.tz_api_format)
         self.output_generator = None  # Initialized in analyze() with output_dir
+        self._quota_index = None  # (model_id, endpoint key) -> quota codes, loaded on first use
+    
+    def _get_quota_index(self):
+        """Load the region's FM list once and resolve each model's quota codes per endpoint
+        
+        Keys are (model_id, endpoint_key) for every endpoint of a model, plus
+        (model_id, None) for the legacy top-level quotas used as the fallback.
+        
+        Returns:
+            dict: (model_id, endpoint_key) -> quota codes (empty if the region has no FM list)
+        """
+        if self._quota_index is None:
+            # Built fully before it is published, so concurrent model workers never see a partial index
+            quota_index = {}
+            try:
+                fm_file = get_data_path(f'fm-list-{self.region}.yml')
+            except FileNotFoundError:
+                fm_file = None
+            
+            if fm_file:
+                data = load_yaml(fm_file)
+                for model in data.get('models', []):
+                    model_id = model['model_id']
+                    # First entry wins, as with the previous linear scan
+                    if (model_id, None) in quota_index:
+                        continue
+                    quota_index[(model_id, None)] = model.get('quotas', {})
+                    for endpoint_key, endpoint in model.get('endpoints', {}).items():
+                        quota_index[(model_id, endpoint_key)] = endpoint.get('quotas', {})
+            self._quota_index = quota_index
+        return self._quota_index
     
     def _load_quota_codes(self, model_id, profile_prefix=None):
         """Load quota codes for a model from FM list based on endpoint
@@ -55,38 +106,23 @@ class BedrockAnalyzer:
         Returns:
             dict: Quota codes for the specified endpoint (tpm, rpm, tpd, concurrent)
         """
-        try:
-            fm_file = get_data_path(f'fm-list-{self.region}.yml')
-        except FileNotFoundError:
-            return {}
-        
-        with open(fm_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            models = data.get('models', [])
-            
-            for model in models:
-                if model['model_id'] == model_id:
-                    endpoints = model.get('endpoints', {})
-                    
-                    # Determine which endpoint to use
-                    endpoint_key = profile_prefix if profile_prefix else 'base'
-                    
-                    # Get quotas from the specified endpoint
-                    if endpoint_key in endpoints:
-                        return endpoints[endpoint_key].get('quotas', {})
-                    
-                    # Fallback to old structure for backward compatibility
-                    return model.get('quotas', {})
-        
-        return {}
+        quota_index = self._get_quota_index()
+        endpoint_key = profile_prefix if profile_prefix else 'base'
+        quotas = quota_index.get((model_id, endpoint_key))
+        if quotas is None:
+            # Fallback to old structure for backward compatibility
+            quotas = quota_index.get((model_id, None), {})
+        return quotas
     
-    def _fetch_quotas(self, model_id, quota_codes, profile_prefix=None):
+    def _fetch_quotas(self, model_id, quota_codes, profile_prefix=None, max_workers=None, log=logger):
         """Fetch quota values from Service Quotas API
         
         Args:
             model_id: Model ID
             quota_codes: Dictionary of quota type to {code, name} or None
             profile_prefix: Endpoint prefix (e.g., 'us', 'eu', 'global') or None for base
+            max_workers: Concurrent quota requests (default: get_max_workers())
+            log: Logger or LoggerAdapter for progress messages
         
         Returns:
             dict: Quota metadata (tpm, rpm, tpd) - each containing {value, code, name, url}
@@ -96,33 +132,33 @@ class BedrockAnalyzer:
         if not quota_codes:
             return quotas
         
-        logger.info(f"  Fetching quotas from Service Quotas API...")
-        for quota_type, quota_data in quota_codes.items():
-            # Handle new structure: {code: L-xxx, name: "..."} or null
-            if quota_data and isinstance(quota_data, dict):
-                code = quota_data.get('code')
-                name = quota_data.get('name')
+        log.info(f"  Fetching quotas from Service Quotas API...")
+        # Handle new structure: {code: L-xxx, name: "..."} or null
+        requests = [
+            (quota_type, quota_data.get('code'), quota_data.get('name'))
+            for quota_type, quota_data in quota_codes.items()
+            if quota_data and isinstance(quota_data, dict) and quota_data.get('code')
+        ]
+        if requests:
+            # One round-trip per quota: issue them concurrently, results come back in request order
+            with ThreadPoolExecutor(max_workers=min(max_workers or get_max_workers(), len(requests))) as executor:
+                values = list(executor.map(
+                    lambda request: self._get_quota_value(model_id, request[0], request[1], log), requests
+                ))
+            
+            for (quota_type, code, name), value in zip(requests, values):
+                if value is None:
+                    continue
+                url = get_service_quota_url(self.region, 'bedrock', code)
                 
-                if code:
-                    try:
-                        response = self.sq_client.get_service_quota(
-                            ServiceCode='bedrock',
-                            QuotaCode=code
-                        )
-                        value = response['Quota']['Value']
-                        url = get_service_quota_url(self.region, 'bedrock', code)
-
-                        quota_info = {'value': value, 'code': code, 'name': name, 'url': url}
-                        
-                        if 'tpm' in quota_type.lower():
-                            quotas['tpm'] = quota_info
-                        elif 'rpm' in quota_type.lower():
-                            quotas['rpm'] = quota_info
-                        elif 'tpd' in quota_type.lower():
-                            quotas['tpd'] = quota_info
-                    
-                    except Exception as e:
-                        logger.info(f"  Warning: Could not fetch {quota_type} quota for {model_id}: {e}")
+                quota_info = {'value': value, 'code': code, 'name': name, 'url': url}
+                
+                if 'tpm' in quota_type.lower():
+                    quotas['tpm'] = quota_info
+                elif 'rpm' in quota_type.lower():
+                    quotas['rpm'] = quota_info
+                elif 'tpd' in quota_type.lower():
+                    quotas['tpd'] = quota_info
         
         # Apply 2x multiplier for TPD on regional cross-region profiles
         regional_profile_prefixes = get_regional_profile_prefixes()
@@ -131,34 +167,67 @@ class BedrockAnalyzer:
         
         return quotas
     
+    def _get_quota_value(self, model_id, quota_type, code, log=logger):
+        """Fetch one quota value from the Service Quotas API
+        
+        Args:
+            model_id: Model ID (for the warning message)
+            quota_type: Quota type key from the FM list (e.g., 'tpm')
+            code: Quota code (L-xxx)
+            log: Logger or LoggerAdapter for the warning message
+        
+        Returns:
+            Quota value, or None if it could not be fetched
+        """
+        try:
+            response = self.sq_client.get_service_quota(
+                ServiceCode='bedrock',
+                QuotaCode=code
+            )
+            return response['Quota']['Value']
+        except Exception as e:
+            log.info(f"  Warning: Could not fetch {quota_type} quota for {model_id}: {e}")
+            return None
+    
     # This aggregates values within 1 Bedrock application profile
     # The aggregation across application inference profiles is implemented in metrics_fetcher.py
     def _calculate_stats_from_time_series(self, ts_data, time_period):
         """Calculate statistics from time series data"""
-        stats = self.metrics_fetcher._initialize_metrics(time_period)
+        stats = CloudWatchMetricsFetcher._initialize_metrics(time_period)
         
-        for metric_name in ts_data:
-            if 'values' in ts_data[metric_name] and ts_data[metric_name]['values']:
-                # Filter out None values (from sparse data handling)
-                values = [v for v in ts_data[metric_name]['values'] if v is not None]
+        for metric_name, series in ts_data.items():
+            values = series.get('values')
+            if values is not None and len(values):
+                # Filter out NaN values (from sparse data handling); gap-free series are used as-is
+                present = ~np.isnan(values)
+                if not present.all():
+                    values = values[present]
+                total = values.sum()
+                if values.size:
+                    # Both percentiles from a single partition of the data
+                    p50, p90 = np.percentile(values, [50, 90])
+                    avg = total / values.size
+                else:
+                    p50 = p90 = avg = 0.0
                 stats[metric_name] = {
                     'values': values,
-                    'p50': np.percentile(values, 50) if values else 0.0,
-                    'p90': np.percentile(values, 90) if values else 0.0,
-                    'count': len(values),
-                    'sum': sum(values),
-                    'avg': np.mean(values) if values else 0.0
+                    'p50': p50,
+                    'p90': p90,
+                    'count': values.size,
+                    'sum': total,
+                    'avg': avg
                 }
         
         return stats
     
-    def _calculate_contributions(self, model_results, time_series_data, profile_names, profile_metadata):
+    def _calculate_contributions(self, model_results, time_series_data, profile_names, profile_metadata, log=logger):
         """Calculate average contributions for each profile per period"""
-        logger.info(f"  Calculating profile contributions...")
+        log.info(f"  Calculating profile contributions...")
         contributions = {}
         
         for time_period in model_results.keys():
             period_contributions = []
+            include_tpd = time_period != '1hour'
             
             for profile_id, stats in model_results[time_period].items():
                 if profile_id == '__AGGREGATED__':
@@ -167,28 +236,32 @@ class BedrockAnalyzer:
                 profile_name = profile_names.get(profile_id, profile_id)
                 metadata = profile_metadata.get(profile_id, {'id': 'N/A', 'tags': {}})
                 
-                # Get p50, p90, avg for each metric
+                # Get p50, p90, avg for each metric (statistics were already computed per profile)
+                tpm = stats.get('TPM', _NO_STATS)
+                rpm = stats.get('RPM', _NO_STATS)
+                tpd = stats.get('TPD', _NO_STATS) if include_tpd else _NO_STATS
+                throttles = stats.get('InvocationThrottles', _NO_STATS)
                 contribution = {
                     'profile_id': profile_id,
                     'profile_name': profile_name,
                     'profile_arn_id': metadata['id'],
                     'profile_tags': metadata['tags'],
-                    'tpm_p50': stats.get('TPM', {}).get('p50', 0),
-                    'tpm_p90': stats.get('TPM', {}).get('p90', 0),
-                    'tpm_avg': stats.get('TPM', {}).get('avg', 0),
-                    'rpm_p50': stats.get('RPM', {}).get('p50', 0),
-                    'rpm_p90': stats.get('RPM', {}).get('p90', 0),
-                    'rpm_avg': stats.get('RPM', {}).get('avg', 0),
-                    'tpd_p50': stats.get('TPD', {}).get('p50', 0) if time_period != '1hour' else 0,
-                    'tpd_p90': stats.get('TPD', {}).get('p90', 0) if time_period != '1hour' else 0,
-                    'tpd_avg': stats.get('TPD', {}).get('avg', 0) if time_period != '1hour' else 0,
-                    'throttles': stats.get('InvocationThrottles', {}).get('sum', 0)
+                    'tpm_p50': tpm.get('p50', 0),
+                    'tpm_p90': tpm.get('p90', 0),
+                    'tpm_avg': tpm.get('avg', 0),
+                    'rpm_p50': rpm.get('p50', 0),
+                    'rpm_p90': rpm.get('p90', 0),
+                    'rpm_avg': rpm.get('avg', 0),
+                    'tpd_p50': tpd.get('p50', 0),
+                    'tpd_p90': tpd.get('p90', 0),
+                    'tpd_avg': tpd.get('avg', 0),
+                    'throttles': throttles.get('sum', 0)
                 }
                 
                 period_contributions.append(contribution)
             
             # Sort by TPM average (descending)
-            period_contributions.sort(key=lambda x: x['tpm_avg'], reverse=True)
+            period_contributions.sort(key=itemgetter('tpm_avg'), reverse=True)
             contributions[time_period] = period_contributions
         
         return contributions
@@ -226,96 +299,129 @@ class BedrockAnalyzer:
         
         logger.info(f"Profile discovery complete.\n")
         
-        # Process each model
+        # Process the models concurrently; each one is independent once profiles are discovered.
+        # Configs for the same model write to the same output file names, so they stay sequential.
+        model_groups = {}
         for model_config in models:
-            model_id = model_config['model_id']
-            profile_prefix = model_config['profile_prefix']
-            
-            logger.info(f"\n{'='*80}")
-            logger.info(f"Processing model: {model_id}")
-            logger.info(f"{'='*80}")
-            
-            # Step 1: Get profiles from cache
-            final_model_ids, profile_names, profile_metadata = all_profiles_map[model_id][profile_prefix]
-            logger.info(f"Using {len(final_model_ids)} profile(s)")
-            
-            # Step 2: Fetch quotas
-            quota_codes = self._load_quota_codes(model_id, profile_prefix)
-            quotas = self._fetch_quotas(model_id, quota_codes, profile_prefix)
-            if any(quotas.values()):
-                logger.info(f"  Quotas: TPM={quotas['tpm']}, RPM={quotas['rpm']}, TPD={quotas['tpd']}")
-            
-            # Step 3: Fetch all data upfront with configured granularities
-            # Data reuse optimization: if all periods use same granularity, only fetch once
-            # If granularities differ, fetch separately for each unique granularity
-            logger.info(f"  Fetching data with configured granularities (parallel)...")
-            fetched_data_all_profiles = self.metrics_fetcher.fetch_all_data_mixed_granularity(
-                final_model_ids, 
-                self.granularity_config
-            )
+            model_groups.setdefault(model_config['model_id'], []).append(model_config)
+        
+        # The model workers share one concurrency budget: the clients' connection pools are sized
+        # for get_max_workers() in-flight calls, so each worker gets an equal share of it
+        max_workers = get_max_workers()
+        model_workers = max(1, min(self.MAX_PARALLEL_MODELS, len(model_groups), max_workers))
+        workers_per_model = max_workers // model_workers
+        
+        with ThreadPoolExecutor(max_workers=model_workers) as executor:
+            futures = [
+                executor.submit(self._process_models, model_configs, all_profiles_map, workers_per_model, model_workers > 1)
+                for model_configs in model_groups.values()
+            ]
+            for future in futures:
+                future.result()
+    
+    def _process_models(self, model_configs, all_profiles_map, max_workers, tag_logs):
+        """Process model configurations one after another (one worker's share of analyze())"""
+        for model_config in model_configs:
+            log = _ModelLogAdapter(logger, {'model_id': model_config['model_id']}) if tag_logs else logger
+            self._process_model(model_config, all_profiles_map, max_workers, log)
+    
+    def _process_model(self, model_config, all_profiles_map, max_workers=None, log=logger):
+        """Fetch, analyze and write the output files for one model
+        
+        Args:
+            model_config: Model configuration (model_id, profile_prefix)
+            all_profiles_map: Discovered profiles from analyze(), read-only here
+            max_workers: This model's share of the concurrent AWS calls (default: get_max_workers())
+            log: Logger or LoggerAdapter for this model's progress messages
+        """
+        model_id = model_config['model_id']
+        profile_prefix = model_config['profile_prefix']
+        metrics_fetcher = CloudWatchMetricsFetcher(self.cloudwatch_client, self.tz_api_format, max_workers, log)
+        
+        log.info(f"\n{'='*80}")
+        log.info(f"Processing model: {model_id}")
+        log.info(f"{'='*80}")
+        
+        # Step 1: Get profiles from cache
+        final_model_ids, profile_names, profile_metadata = all_profiles_map[model_id][profile_prefix]
+        log.info(f"Using {len(final_model_ids)} profile(s)")
+        
+        # Step 2: Fetch quotas
+        quota_codes = self._load_quota_codes(model_id, profile_prefix)
+        quotas = self._fetch_quotas(model_id, quota_codes, profile_prefix, max_workers, log)
+        if any(quotas.values()):
+            log.info(f"  Quotas: TPM={quotas['tpm']}, RPM={quotas['rpm']}, TPD={quotas['tpd']}")
+        
+        # Step 3: Fetch all data upfront with configured granularities
+        # Data reuse optimization: if all periods use same granularity, only fetch once
+        # If granularities differ, fetch separately for each unique granularity
+        log.info(f"  Fetching data with configured granularities (parallel)...")
+        fetched_data_all_profiles = metrics_fetcher.fetch_all_data_mixed_granularity(
+            final_model_ids, 
+            self.granularity_config
+        )
+        
+        model_results = {}
+        time_series_data = {}
+        
+        # Step 4: Process each time period
+        for time_period in self.TIME_PERIODS:
+            log.info(f"  Processing {time_period}...")
             
-            model_results = {}
-            time_series_data = {}
+            period_stats = {}
+            period_time_series = {}
             
-            # Step 4: Process each time period
-            for time_period in self.TIME_PERIODS:
-                logger.info(f"  Processing {time_period}...")
+            try:
+                for final_model_id in final_model_ids:
+                    # Slice data from fetched datasets
+                    if final_model_id in fetched_data_all_profiles:
+                        ts_data = metrics_fetcher.slice_and_process_data(
+                            fetched_data_all_profiles[final_model_id], 
+                            time_period,
+                            self.granularity_config
+                        )
+                        period_time_series[final_model_id] = ts_data
+                        
+                        # Calculate statistics from time series data
+                        stats = self._calculate_stats_from_time_series(ts_data, time_period)
+                        period_stats[final_model_id] = stats
                 
-                period_stats = {}
-                period_time_series = {}
+                # Always create aggregated metrics for consistent template behavior
+                agg_stats = metrics_fetcher.aggregate_statistics(period_stats, time_period)
+                agg_ts = metrics_fetcher.aggregate_time_series(period_time_series, time_period)
                 
-                try:
-                    for final_model_id in final_model_ids:
-                        # Slice data from fetched datasets
-                        if final_model_id in fetched_data_all_profiles:
-                            ts_data = self.metrics_fetcher.slice_and_process_data(
-                                fetched_data_all_profiles[final_model_id], 
-                                time_period,
-                                self.granularity_config
-                            )
-                            period_time_series[final_model_id] = ts_data
-                            
-                            # Calculate statistics from time series data
-                            stats = self._calculate_stats_from_time_series(ts_data, time_period)
-                            period_stats[final_model_id] = stats
-                    
-                    # Always create aggregated metrics for consistent template behavior
-                    agg_stats = self.metrics_fetcher.aggregate_statistics(period_stats, time_period)
-                    agg_ts = self.metrics_fetcher.aggregate_time_series(period_time_series, time_period)
-                    
-                    period_stats['__AGGREGATED__'] = agg_stats
-                    period_time_series['__AGGREGATED__'] = agg_ts
-                    
-                    model_results[time_period] = period_stats
-                    time_series_data[time_period] = period_time_series
-                    
-                except Exception as e:
-                    logger.info(f"\n  ERROR in {time_period} processing:")
-                    logger.info(f"  Error type: {type(e).__name__}")
-                    logger.info(f"  Error message: {e}")
-                    logger.info(f"  Traceback:")
-                    traceback.print_exc()
-                    raise
-            
-            # Step 5: Calculate contributions
-            contributions = self._calculate_contributions(model_results, time_series_data, profile_names, profile_metadata)
-            
-            # Step 6: Generate output
-            logger.info(f"  Generating output files...")
-            end_time_local = datetime.now(self.local_tz)
-            self.output_generator.generate({
-                model_id: {
-                    'stats': model_results,
-                    'time_series': time_series_data,
-                    'quotas': quotas,
-                    'profile_names': profile_names,
-                    'contributions': contributions,
-                    'granularity_config': self.granularity_config,
-                    'end_time': end_time_local,
-                    'tz_offset': self.tz_offset,
-                    'region': self.region
-                }
-            })
+                period_stats['__AGGREGATED__'] = agg_stats
+                period_time_series['__AGGREGATED__'] = agg_ts
+                
+                model_results[time_period] = period_stats
+                time_series_data[time_period] = period_time_series
+                
+            except Exception as e:
+                log.info(f"\n  ERROR in {time_period} processing:")
+                log.info(f"  Error type: {type(e).__name__}")
+                log.info(f"  Error message: {e}")
+                log.exception(f"  Traceback:")
+                raise
+        
+        # Step 5: Calculate contributions
+        contributions = self._calculate_contributions(model_results, time_series_data, profile_names, profile_metadata, log)
+        
+        # Step 6: Generate output
+        log.info(f"  Generating output files...")
+        end_time_local = datetime.now(self.local_tz)
+        self.output_generator.generate({
+            model_id: {
+                'stats': model_results,
+                'time_series': time_series_data,
+                'quotas': quotas,
+                'profile_names': profile_names,
+                'contributions': contributions,
+                'granularity_config': self.granularity_config,
+                'end_time': end_time_local,
+                'tz_offset': self.tz_offset,
+                'region': self.region
+            }
+        })
 
 
 def main():
@@ -3,81 +3,114 @@
 
 """CloudWatch metrics fetching for Bedrock usage analysis"""
 
-import os
 import numpy as np
 from datetime import datetime, timedelta, timezone
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from collections import defaultdict
+from itertools import count, product
+
+from bedrock_usage_analyzer.aws.clients import get_max_workers
 
 logger = logging.getLogger(__name__)
 
+# (dataset key, CloudWatch metric name, statistic) for each fetched metric
+# The "Sum" statistic aggregates data points within the period; latency is averaged instead
+TOKEN_METRICS = [
+    ('invocations', 'Invocations', 'Sum'),
+    ('input_tokens', 'InputTokenCount', 'Sum'),
+    ('output_tokens', 'OutputTokenCount', 'Sum')
+]
+OTHER_METRICS = [
+    ('throttles', 'InvocationThrottles', 'Sum'),
+    ('client_errors', 'InvocationClientErrors', 'Sum'),
+    ('server_errors', 'InvocationServerErrors', 'Sum'),
+    ('latency', 'InvocationLatency', 'Average')
+]
+
+# GetMetricData accepts at most 500 queries per request
+MAX_QUERIES_PER_REQUEST = 500
+
 class CloudWatchMetricsFetcher:
     """Handles CloudWatch metrics retrieval"""
     
-    def __init__(self, cloudwatch_client, tz_api_format='+0000'):
+    def __init__(self, cloudwatch_client, tz_api_format='+0000', max_workers=None, log=None):
+        """Initialize the fetcher
+        
+        Args:
+            cloudwatch_client: Boto3 CloudWatch client
+            tz_api_format: Timezone offset for CloudWatch (e.g., '+0000')
+            max_workers: Concurrent GetMetricData requests (default: get_max_workers())
+            log: Logger or LoggerAdapter for progress messages (default: module logger)
+        """
         self.cloudwatch_client = cloudwatch_client
         self.tz_api_format = tz_api_format
-        self.progress_lock = Lock()
-        self.chunks_completed = 0
-        self.total_chunks = 0
+        self.max_workers = max_workers
+        self.log = log or logger
     
     def _process_combined_time_series(self, all_data, timestamps, period, time_period, target_period=None, end_time=None):
         """Process combined time series data from multiple chunks
         
         Args:
             all_data: Dict of metric data arrays
-            timestamps: List of timestamps
+            timestamps: datetime64[s] array (or list of datetimes) of the data points
             period: Source data period in seconds (e.g., 60 for 1-min data)
             time_period: Time period name (e.g., '7days')
             target_period: Target aggregation period in seconds (e.g., 300 for 5-min peaks)
                           If None or same as period, no aggregation needed
             end_time: datetime object for TPD window reference (optional)
+        
+        Returns:
+            Dict of metric name -> {'timestamps': datetime64[s] array (UTC), 'values': float64 array}
+            with NaN marking missing data points
         """
         # If target_period not specified or same as source, no aggregation needed
         if target_period is None or target_period == period:
             target_period = period
+        chart_period = target_period if target_period > period else period
             
         period_minutes = period / 60
         
         result = {}
         
         # Sort timestamps and align all data arrays
-        # Technique: Create sorted indices from timestamps, then apply same reordering to all metric arrays
-        if timestamps:
-            sorted_indices = sorted(range(len(timestamps)), key=lambda i: timestamps[i])
-            timestamps = [timestamps[i] for i in sorted_indices]
-            
-            # Sort all data arrays using the same indices
-            for key in all_data:
-                if all_data[key] and len(all_data[key]) == len(timestamps):
-                    all_data[key] = [all_data[key][i] for i in sorted_indices]
+        # Technique: argsort the timestamps once, then fancy-index every metric array with the same permutation.
+        # Data fetched with ScanBy=TimestampAscending is normally monotonic already, so skip the reorder then
+        ts = self._to_datetime64(timestamps)
+        sorted_indices = None
+        if (ts[1:] < ts[:-1]).any():
+            sorted_indices = np.argsort(ts, kind='stable')
+            ts = ts[sorted_indices]
+        
+        # None becomes NaN so missing points can be masked with vectorized ops
+        arrays = {}
+        for key, values in all_data.items():
+            arr = np.asarray(values, dtype=np.float64)
+            if sorted_indices is not None and len(arr) == len(ts):
+                arr = arr[sorted_indices]
+            arrays[key] = arr
+        
+        # Raw metrics all sit on the same timestamps, so build their gap-filled grid once
+        # and scatter each metric into it instead of regenerating the grid per metric
+        if len(ts):
+            grid, grid_positions = self._grid_positions(ts, period)
         
         # Process each metric
-        input_tokens = all_data['input_tokens']
-        output_tokens = all_data['output_tokens']
+        input_tokens = arrays['input_tokens']
+        output_tokens = arrays['output_tokens']
         
-        if input_tokens and output_tokens:
+        if input_tokens.size and output_tokens.size:
             # Calculate TPM only for timestamps where BOTH input and output exist (not None)
-            total_tokens = []
-            valid_timestamps = []
-            
-            for i, ts in enumerate(timestamps):
-                inp_val = input_tokens[i] if i < len(input_tokens) else None
-                out_val = output_tokens[i] if i < len(output_tokens) else None
-                
-                if inp_val is not None and out_val is not None:
-                    total_tokens.append(inp_val + out_val)
-                    valid_timestamps.append(ts)
+            n = min(len(ts), len(input_tokens), len(output_tokens))
+            both_valid = ~np.isnan(input_tokens[:n]) & ~np.isnan(output_tokens[:n])
+            total_tokens = (input_tokens[:n] + output_tokens[:n])[both_valid]
+            valid_timestamps = ts[:n][both_valid]
             
-            if total_tokens:
-                tpm_values_1min = [t / period_minutes for t in total_tokens]
+            if total_tokens.size:
+                tpm_values_1min = total_tokens / period_minutes
                 
                 # Store 1-min values for statistics (always per-minute)
-                ts_strings_1min = [ts.isoformat() for ts in valid_timestamps]
                 result['TPM_1min'] = {
-                    'timestamps': ts_strings_1min,
+                    'timestamps': valid_timestamps,
                     'values': tpm_values_1min
                 }
                 
@@ -88,54 +121,46 @@ class CloudWatchMetricsFetcher:
                     valid_timestamps_chart, tpm_values_chart = self._aggregate_to_peak(valid_timestamps, tpm_values_1min, period, target_period)
                 
                 # Fill missing timestamps for TPM chart
-                ts_strings = [ts.isoformat() for ts in valid_timestamps_chart]
-                filled_ts, filled_tpm = self._fill_missing_timestamps(ts_strings, tpm_values_chart, target_period if target_period > period else period)
+                filled_ts, filled_tpm = self._fill_missing_timestamps(valid_timestamps_chart, tpm_values_chart, chart_period)
                 
                 result['TPM'] = {
                     'timestamps': filled_ts,
                     'values': filled_tpm
                 }
                 
-                # Also include raw token counts (with None values preserved)
-                ts_strings_all = [ts.isoformat() for ts in timestamps]
-                filled_ts_input, filled_input = self._fill_missing_timestamps(ts_strings_all, input_tokens, period)
-                filled_ts_output, filled_output = self._fill_missing_timestamps(ts_strings_all, output_tokens, period)
-                
+                # Also include raw token counts (with missing values preserved as NaN)
                 result['InputTokenCount'] = {
-                    'timestamps': filled_ts_input,
-                    'values': filled_input
+                    'timestamps': grid,
+                    'values': self._scatter_to_grid(grid, grid_positions, input_tokens)
                 }
                 result['OutputTokenCount'] = {
-                    'timestamps': filled_ts_output,
-                    'values': filled_output
+                    'timestamps': grid,
+                    'values': self._scatter_to_grid(grid, grid_positions, output_tokens)
                 }
             
-            if time_period != "1hour" and total_tokens:
+            if time_period != "1hour" and total_tokens.size:
                 # TPD: Aggregate tokens by day (sum all tokens within each day)
                 # Note: TPD uses daily aggregation, not granularity-based filling
-                ts_strings_valid = [ts.isoformat() for ts in valid_timestamps]
                 # Use end_time if provided, otherwise fall back to datetime.now()
                 reference_time = end_time if end_time else datetime.now(timezone.utc)
-                daily_timestamps, daily_totals = self._aggregate_tokens_by_day(ts_strings_valid, total_tokens, reference_time)
+                daily_timestamps, daily_totals = self._aggregate_tokens_by_day(valid_timestamps, total_tokens, reference_time)
                 result['TPD'] = {
                     'timestamps': daily_timestamps,
                     'values': daily_totals
                 }
         
-        if all_data['invocations']:
+        invocations = arrays['invocations']
+        if invocations.size:
             # Filter out None values for RPM calculation
-            rpm_values = []
-            rpm_timestamps = []
-            for i, inv in enumerate(all_data['invocations']):
-                if inv is not None:
-                    rpm_values.append(inv / period_minutes)
-                    rpm_timestamps.append(timestamps[i])
+            n = min(len(ts), len(invocations))
+            inv_valid = ~np.isnan(invocations[:n])
+            rpm_values = invocations[:n][inv_valid] / period_minutes
+            rpm_timestamps = ts[:n][inv_valid]
             
-            if rpm_values:
+            if rpm_values.size:
                 # Store 1-min values for statistics (always per-minute)
-                ts_strings_1min = [ts.isoformat() for ts in rpm_timestamps]
                 result['RPM_1min'] = {
-                    'timestamps': ts_strings_1min,
+                    'timestamps': rpm_timestamps,
                     'values': rpm_values
                 }
                 
@@ -145,52 +170,27 @@ class CloudWatchMetricsFetcher:
                 if target_period > period:
                     rpm_timestamps_chart, rpm_values_chart = self._aggregate_to_peak(rpm_timestamps, rpm_values, period, target_period)
                 
-                ts_strings = [ts.isoformat() for ts in rpm_timestamps_chart]
-                filled_ts_rpm, filled_rpm = self._fill_missing_timestamps(ts_strings, rpm_values_chart, target_period if target_period > period else period)
+                filled_ts_rpm, filled_rpm = self._fill_missing_timestamps(rpm_timestamps_chart, rpm_values_chart, chart_period)
                 result['RPM'] = {
                     'timestamps': filled_ts_rpm,
                     'values': filled_rpm
                 }
                 
-                # Also include raw invocations count (with None preserved)
-                ts_strings_all = [ts.isoformat() for ts in timestamps]
-                filled_ts_inv, filled_inv = self._fill_missing_timestamps(ts_strings_all, all_data['invocations'], period)
+                # Also include raw invocations count (with missing values preserved as NaN)
                 result['Invocations'] = {
-                    'timestamps': filled_ts_inv,
-                    'values': filled_inv
+                    'timestamps': grid,
+                    'values': self._scatter_to_grid(grid, grid_positions, invocations)
                 }
         
-        if all_data['throttles']:
-            ts_strings = [ts.isoformat() for ts in timestamps]
-            filled_ts, filled_vals = self._fill_missing_timestamps(ts_strings, all_data['throttles'], period)
-            result['InvocationThrottles'] = {
-                'timestamps': filled_ts,
-                'values': filled_vals
-            }
-        
-        if all_data['client_errors']:
-            ts_strings = [ts.isoformat() for ts in timestamps]
-            filled_ts, filled_vals = self._fill_missing_timestamps(ts_strings, all_data['client_errors'], period)
-            result['InvocationClientErrors'] = {
-                'timestamps': filled_ts,
-                'values': filled_vals
-            }
-        
-        if all_data['server_errors']:
-            ts_strings = [ts.isoformat() for ts in timestamps]
-            filled_ts, filled_vals = self._fill_missing_timestamps(ts_strings, all_data['server_errors'], period)
-            result['InvocationServerErrors'] = {
-                'timestamps': filled_ts,
-                'values': filled_vals
-            }
-        
-        if all_data['latency']:
-            ts_strings = [ts.isoformat() for ts in timestamps]
-            filled_ts, filled_vals = self._fill_missing_timestamps(ts_strings, all_data['latency'], period)
-            result['InvocationLatency'] = {
-                'timestamps': filled_ts,
-                'values': filled_vals
-            }
+        for key, metric_name in (('throttles', 'InvocationThrottles'),
+                                 ('client_errors', 'InvocationClientErrors'),
+                                 ('server_errors', 'InvocationServerErrors'),
+                                 ('latency', 'InvocationLatency')):
+            if arrays[key].size and len(ts):
+                result[metric_name] = {
+                    'timestamps': grid,
+                    'values': self._scatter_to_grid(grid, grid_positions, arrays[key])
+                }
         
         # If no data was processed, return properly structured empty time series
         if not result:
@@ -198,6 +198,13 @@ class CloudWatchMetricsFetcher:
         
         return result
     
+    def _to_datetime64(self, timestamps):
+        """Convert a list of timezone-aware datetimes to a UTC datetime64[s] array"""
+        if isinstance(timestamps, np.ndarray):
+            return timestamps.astype('datetime64[s]', copy=False)
+        epochs = np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(timestamps))
+        return epochs.astype(np.int64).astype('datetime64[s]')
+    
     def _align_to_period_boundary(self, dt, period_seconds):
         """Align datetime to period boundary by rounding down
         
@@ -240,8 +247,8 @@ class CloudWatchMetricsFetcher:
             model_ids: List of model IDs to fetch
             granularity_config: Dict mapping time_period to granularity in seconds
         """
-        logger.info(f"  Starting parallel CloudWatch data fetch...")
-        logger.info(f"  Granularity config: {granularity_config}")
+        self.log.info(f"  Starting parallel CloudWatch data fetch...")
+        self.log.info(f"  Granularity config: {granularity_config}")
         
         # Align end_time to 1-minute boundary (finest granularity for token metrics)
         end_time = datetime.now(timezone.utc)
@@ -278,333 +285,198 @@ class CloudWatchMetricsFetcher:
                 'metrics': ['throttles', 'client_errors', 'server_errors', 'latency']
             }
         
-        # Calculate total chunks for progress tracking
-        self.chunks_completed = 0
-        self.total_chunks = 0
-        for model_id in model_ids:
-            # Token metrics at 1-min
-            chunks = self._chunk_time_range(token_metrics_config['start_time'], 
-                                           token_metrics_config['end_time'], 60)
-            self.total_chunks += len(chunks)
-            # Other metrics at configured granularities
-            for period, config in other_metrics_configs.items():
-                chunks = self._chunk_time_range(config['start_time'], config['end_time'], period)
-                self.total_chunks += len(chunks)
+        # One fetch per time span; all models share batched GetMetricData requests within a span
+        fetch_configs = [('token', 60, token_metrics_config['start_time'], TOKEN_METRICS)]
+        for period, config in other_metrics_configs.items():
+            fetch_configs.append(('other', period, config['start_time'], OTHER_METRICS))
+        
+        # Build every batched request up front so they can all be sent concurrently
+        fetch_plans = []
+        for fetch_type, period, start_time, metrics in fetch_configs:
+            query_targets, requests = self._build_metric_requests(model_ids, metrics, start_time, end_time, period)
+            fetch_plans.append((fetch_type, period, metrics, query_targets, requests))
+        
+        # Total requests for progress tracking. Kept per call (not on the instance) so concurrent
+        # fetches report their own progress; next() on itertools.count is atomic under the GIL.
+        chunk_counter = count(1)
+        total_chunks = sum(len(requests) for _, _, _, _, requests in fetch_plans)
         
-        logger.info(f"  Fetching {len(model_ids)} model(s): token metrics at 1-min + other metrics at configured granularities")
-        logger.info(f"  Total chunks: {self.total_chunks}")
+        self.log.info(f"  Fetching {len(model_ids)} model(s): token metrics at 1-min + other metrics at configured granularities")
+        self.log.info(f"  Total chunks: {total_chunks}")
         
-        all_fetched_data = {}
+        all_fetched_data = {model_id: {'end_time': end_time} for model_id in model_ids}
         
-        # Parallel fetching across all model IDs
-        max_workers = os.cpu_count() or 4
-        logger.info(f"  Using {max_workers} parallel workers")
+        # Parallel fetching across every (time span, query batch, time chunk) request
+        max_workers = max(1, min(self.max_workers or get_max_workers(), total_chunks))
+        self.log.info(f"  Using {max_workers} parallel workers")
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            
-            for model_id in model_ids:
-                # Fetch 1: Token metrics at 1-min
-                future = executor.submit(
-                    self._fetch_token_metrics,
-                    model_id,
-                    token_metrics_config['start_time'],
-                    token_metrics_config['end_time'],
-                    60
-                )
-                futures.append((future, model_id, 60, 'token'))
-                
-                # Fetch 2: Other metrics at configured granularities
-                for period, config in other_metrics_configs.items():
-                    future = executor.submit(
-                        self._fetch_other_metrics,
-                        model_id,
-                        config['start_time'],
-                        config['end_time'],
-                        period
-                    )
-                    futures.append((future, model_id, period, 'other'))
+            submitted = [
+                (fetch_type, period, metrics, query_targets,
+                 [executor.submit(self._get_metric_data, request, chunk_counter, total_chunks) for request in requests])
+                for fetch_type, period, metrics, query_targets, requests in fetch_plans
+            ]
             
-            for future, model_id, period, fetch_type in futures:
-                if model_id not in all_fetched_data:
-                    logger.info(f"  Fetching data for {model_id}...")
-                    all_fetched_data[model_id] = {'end_time': end_time}
-                
+            for fetch_type, period, metrics, query_targets, futures in submitted:
                 try:
-                    new_data = future.result()
-                    
-                    # Store token metrics separately with '60_token' key
-                    if fetch_type == 'token':
-                        all_fetched_data[model_id]['60_token'] = new_data
-                    else:
-                        # Merge other metrics into the period's data
-                        if period not in all_fetched_data[model_id]:
-                            all_fetched_data[model_id][period] = new_data
-                        else:
-                            # Merge if period already exists
-                            existing = all_fetched_data[model_id][period]
-                            for key in new_data['data']:
-                                existing['data'][key] = new_data['data'][key]
-                        
+                    # Results are combined in request order, independent of completion order
+                    results = [result for future in futures for result in future.result()]
+                    datasets = self._collect_metric_results(model_ids, metrics, query_targets, results, period)
                 except Exception as e:
-                    logger.info(f"    Warning: Failed to fetch {fetch_type} data (period={period}s) for {model_id}: {e}")
-                    # Create empty data structure
-                    empty_data = {
-                        'timestamps': [], 
-                        'data': {
-                            'invocations': [], 
-                            'input_tokens': [], 
-                            'output_tokens': [], 
-                            'throttles': [],
-                            'client_errors': [],
-                            'server_errors': [],
-                            'latency': []
-                        }, 
-                        'period': period
-                    }
-                    if fetch_type == 'token':
-                        all_fetched_data[model_id]['60_token'] = empty_data
-                    else:
-                        all_fetched_data[model_id][period] = empty_data
-        
-        logger.info(f"  Parallel fetch complete")
+                    self.log.info(f"    Warning: Could not fetch metrics (period={period}s): {e}")
+                    datasets = self._empty_datasets(model_ids, metrics, period)
+                
+                # Store token metrics separately with '60_token' key
+                data_key = '60_token' if fetch_type == 'token' else period
+                for model_id, dataset in datasets.items():
+                    all_fetched_data[model_id][data_key] = dataset
+        
+        self.log.info(f"  Parallel fetch complete")
         
         return all_fetched_data
     
-    def _fetch_token_metrics(self, model_id, start_time, end_time, period):
-        """Fetch only token-related metrics (for TPM/RPM calculation)
+    def _build_metric_requests(self, model_ids, metrics, start_time, end_time, period):
+        """Build batched GetMetricData requests covering all models over a time range
+        
+        Each (model, metric) pair becomes one query with a positional Id (m0, m1, ...).
+        Queries are packed up to MAX_QUERIES_PER_REQUEST per request, with one request
+        per batch and time chunk.
         
-        Always fetched at 1-minute granularity for accurate peak detection
+        Args:
+            model_ids: List of model IDs to fetch
+            metrics: List of (key, metric_name, stat) tuples, e.g. TOKEN_METRICS
+            start_time: Start of time range
+            end_time: End of time range
+            period: Granularity in seconds
+        
+        Returns:
+            tuple: (query_targets, requests) where query_targets[i] is the (model_id, metric) of query m{i}
         """
-        try:
-            chunks = self._chunk_time_range(start_time, end_time, period)
-            
-            all_data_with_timestamps = {
-                'invocations': {'timestamps': [], 'values': []},
-                'input_tokens': {'timestamps': [], 'values': []},
-                'output_tokens': {'timestamps': [], 'values': []}
-            }
-            
-            for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
-                response = self.cloudwatch_client.get_metric_data(
-                    MetricDataQueries=[
-                        self._create_query('invocations', 'Invocations', model_id, period),
-                        self._create_query('input_tokens', 'InputTokenCount', model_id, period),
-                        self._create_query('output_tokens', 'OutputTokenCount', model_id, period)
-                    ],
-                    StartTime=chunk_start,
-                    EndTime=chunk_end,
-                    LabelOptions={'Timezone': self.tz_api_format}
-                )
-                
-                with self.progress_lock:
-                    self.chunks_completed += 1
-                    pct = int(self.chunks_completed / self.total_chunks * 100)
-                    logger.info(f"    Progress: {self.chunks_completed}/{self.total_chunks} chunks ({pct}%)")
-                
-                for result in response['MetricDataResults']:
-                    metric_id = result['Id']
-                    if result['Values'] and result['Timestamps']:
-                        all_data_with_timestamps[metric_id]['values'].extend(result['Values'])
-                        all_data_with_timestamps[metric_id]['timestamps'].extend(result['Timestamps'])
-            
-            # Align data by timestamps
-            all_timestamps_set = set()
-            for metric_data in all_data_with_timestamps.values():
-                all_timestamps_set.update(metric_data['timestamps'])
-            
-            all_timestamps = sorted(list(all_timestamps_set))
-            
-            all_data = {}
-            for metric_id, metric_data in all_data_with_timestamps.items():
-                ts_to_value = {ts: val for ts, val in zip(metric_data['timestamps'], metric_data['values'])}
-                all_data[metric_id] = [ts_to_value.get(ts) for ts in all_timestamps]
-            
-            # Sort chronologically
-            if all_timestamps:
-                sorted_indices = sorted(range(len(all_timestamps)), key=lambda i: all_timestamps[i])
-                all_timestamps = [all_timestamps[i] for i in sorted_indices]
-                for key in all_data:
-                    if all_data[key] and len(all_data[key]) == len(all_timestamps):
-                        all_data[key] = [all_data[key][i] for i in sorted_indices]
-            
-            return {
-                'timestamps': all_timestamps,
-                'data': all_data,
-                'period': period
-            }
-        except Exception as e:
-            logger.info(f"    Warning: Could not fetch token metrics: {e}")
-            return {
-                'timestamps': [],
-                'data': {'invocations': [], 'input_tokens': [], 'output_tokens': []},
-                'period': period
-            }
+        # Queries and label options are identical for every chunk, so build them once
+        query_targets = list(product(model_ids, metrics))
+        label_options = {'Timezone': self.tz_api_format}
+        queries = [
+            self._create_query(f"m{i}", metric_name, model_id, period, stat)
+            for i, (model_id, (_, metric_name, stat)) in enumerate(query_targets)
+        ]
+        
+        chunks = self._chunk_time_range(start_time, end_time, period)
+        requests = []
+        for batch_start in range(0, len(queries), MAX_QUERIES_PER_REQUEST):
+            batch = queries[batch_start:batch_start + MAX_QUERIES_PER_REQUEST]
+            for chunk_start, chunk_end in chunks:
+                requests.append({
+                    'MetricDataQueries': batch,
+                    'StartTime': chunk_start,
+                    'EndTime': chunk_end,
+                    'ScanBy': 'TimestampAscending',
+                    'LabelOptions': label_options
+                })
+        
+        return query_targets, requests
     
-    def _fetch_other_metrics(self, model_id, start_time, end_time, period):
-        """Fetch non-token metrics (throttles, errors, latency)
+    def _get_metric_data(self, request, chunk_counter, total_chunks):
+        """Send one GetMetricData request, following NextToken pagination
+        
+        Args:
+            request: Request kwargs from _build_metric_requests
+            chunk_counter: Shared itertools.count for progress reporting
+            total_chunks: Number of requests in this fetch
         
-        Fetched at configured granularity
+        Returns:
+            List of MetricDataResults from every page
         """
-        try:
-            chunks = self._chunk_time_range(start_time, end_time, period)
-            
-            all_data_with_timestamps = {
-                'throttles': {'timestamps': [], 'values': []},
-                'client_errors': {'timestamps': [], 'values': []},
-                'server_errors': {'timestamps': [], 'values': []},
-                'latency': {'timestamps': [], 'values': []}
-            }
-            
-            for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
-                response = self.cloudwatch_client.get_metric_data(
-                    MetricDataQueries=[
-                        self._create_query('throttles', 'InvocationThrottles', model_id, period),
-                        self._create_query('client_errors', 'InvocationClientErrors', model_id, period),
-                        self._create_query('server_errors', 'InvocationServerErrors', model_id, period),
-                        self._create_query('latency', 'InvocationLatency', model_id, period, stat='Average')
-                    ],
-                    StartTime=chunk_start,
-                    EndTime=chunk_end,
-                    LabelOptions={'Timezone': self.tz_api_format}
-                )
-                
-                with self.progress_lock:
-                    self.chunks_completed += 1
-                    pct = int(self.chunks_completed / self.total_chunks * 100)
-                    logger.info(f"    Progress: {self.chunks_completed}/{self.total_chunks} chunks ({pct}%)")
-                
-                for result in response['MetricDataResults']:
-                    metric_id = result['Id']
-                    if result['Values'] and result['Timestamps']:
-                        all_data_with_timestamps[metric_id]['values'].extend(result['Values'])
-                        all_data_with_timestamps[metric_id]['timestamps'].extend(result['Timestamps'])
-            
-            # Align data by timestamps
-            all_timestamps_set = set()
-            for metric_data in all_data_with_timestamps.values():
-                all_timestamps_set.update(metric_data['timestamps'])
-            
-            all_timestamps = sorted(list(all_timestamps_set))
-            
-            all_data = {}
-            for metric_id, metric_data in all_data_with_timestamps.items():
-                ts_to_value = {ts: val for ts, val in zip(metric_data['timestamps'], metric_data['values'])}
-                all_data[metric_id] = [ts_to_value.get(ts) for ts in all_timestamps]
-            
-            # Sort chronologically
-            if all_timestamps:
-                sorted_indices = sorted(range(len(all_timestamps)), key=lambda i: all_timestamps[i])
-                all_timestamps = [all_timestamps[i] for i in sorted_indices]
-                for key in all_data:
-                    if all_data[key] and len(all_data[key]) == len(all_timestamps):
-                        all_data[key] = [all_data[key][i] for i in sorted_indices]
-            
-            return {
-                'timestamps': all_timestamps,
-                'data': all_data,
-                'period': period
-            }
-        except Exception as e:
-            logger.info(f"    Warning: Could not fetch other metrics: {e}")
-            return {
-                'timestamps': [],
-                'data': {'throttles': [], 'client_errors': [], 'server_errors': [], 'latency': []},
-                'period': period
-            }
+        request = dict(request)
+        results = []
+        while True:
+            response = self.cloudwatch_client.get_metric_data(**request)
+            results.extend(response['MetricDataResults'])
+            
+            if not response.get('NextToken'):
+                break
+            request['NextToken'] = response['NextToken']
+        
+        chunks_completed = next(chunk_counter)
+        pct = int(chunks_completed / total_chunks * 100)
+        self.log.info(f"    Progress: {chunks_completed}/{total_chunks} chunks ({pct}%)")
+        return results
     
-    def _fetch_raw_data(self, model_id, start_time, end_time, period):
-        """Fetch raw CloudWatch data for a time range"""
-        try:
-            chunks = self._chunk_time_range(start_time, end_time, period)
-            
-            # Store timestamps per metric for proper alignment
-            all_data_with_timestamps = {
-                'invocations': {'timestamps': [], 'values': []},
-                'input_tokens': {'timestamps': [], 'values': []},
-                'output_tokens': {'timestamps': [], 'values': []},
-                'throttles': {'timestamps': [], 'values': []},
-                'client_errors': {'timestamps': [], 'values': []},
-                'server_errors': {'timestamps': [], 'values': []},
-                'latency': {'timestamps': [], 'values': []}
-            }
-            
-            for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
-                # All metrics are using "Sum" statistic aggregation method, except InvocationLatency which is using "Average"
-                response = self.cloudwatch_client.get_metric_data(
-                    MetricDataQueries=[
-                        self._create_query('invocations', 'Invocations', model_id, period),
-                        self._create_query('input_tokens', 'InputTokenCount', model_id, period),
-                        self._create_query('output_tokens', 'OutputTokenCount', model_id, period),
-                        self._create_query('throttles', 'InvocationThrottles', model_id, period),
-                        self._create_query('client_errors', 'InvocationClientErrors', model_id, period),
-                        self._create_query('server_errors', 'InvocationServerErrors', model_id, period),
-                        self._create_query('latency', 'InvocationLatency', model_id, period, stat='Average')
-                    ],
-                    StartTime=chunk_start,
-                    EndTime=chunk_end,
-                    LabelOptions={'Timezone': self.tz_api_format}
-                )
-                
-                # Update progress
-                with self.progress_lock:
-                    self.chunks_completed += 1
-                    pct = int(self.chunks_completed / self.total_chunks * 100)
-                    logger.info(f"    Progress: {self.chunks_completed}/{self.total_chunks} chunks ({pct}%)")
-                
-                # Collect timestamps AND values for each metric separately
-                for result in response['MetricDataResults']:
-                    metric_id = result['Id']
-                    if result['Values'] and result['Timestamps']:
-                        all_data_with_timestamps[metric_id]['values'].extend(result['Values'])
-                        all_data_with_timestamps[metric_id]['timestamps'].extend(result['Timestamps'])
-            
-            # Align data by timestamps: collect all unique timestamps and map values
-            all_timestamps_set = set()
-            for metric_data in all_data_with_timestamps.values():
-                all_timestamps_set.update(metric_data['timestamps'])
-            
-            all_timestamps = sorted(list(all_timestamps_set))
-            
-            # Create timestamp-to-value mapping for each metric
-            all_data = {}
-            for metric_id, metric_data in all_data_with_timestamps.items():
-                # Build mapping
-                ts_to_value = {ts: val for ts, val in zip(metric_data['timestamps'], metric_data['values'])}
-                # Align to all_timestamps (use None for missing timestamps)
-                all_data[metric_id] = [ts_to_value.get(ts) for ts in all_timestamps]
-            
-            # Sort timestamps chronologically and reorder all metrics to match
-            # CloudWatch doesn't guarantee order, especially across multiple chunks
-            # This ensures data integrity: each metric value stays aligned with its timestamp
-            # Technique: Create sorted indices from timestamps, then apply same reordering to all metric arrays
-            if all_timestamps:
-                sorted_indices = sorted(range(len(all_timestamps)), key=lambda i: all_timestamps[i])
-                all_timestamps = [all_timestamps[i] for i in sorted_indices]
-                for key in all_data:
-                    if all_data[key] and len(all_data[key]) == len(all_timestamps):
-                        all_data[key] = [all_data[key][i] for i in sorted_indices]
-            
-            return {
-                'timestamps': all_timestamps,
-                'data': all_data,
-                'period': period
-            }
-        except Exception as e:
-            logger.info(f"    Warning: Could not fetch data: {e}")
-            return {
-                'timestamps': [], 
-                'data': {
-                    'invocations': [], 
-                    'input_tokens': [], 
-                    'output_tokens': [], 
-                    'throttles': [],
-                    'client_errors': [],
-                    'server_errors': [],
-                    'latency': []
-                }, 
+    def _collect_metric_results(self, model_ids, metrics, query_targets, results, period):
+        """Demultiplex MetricDataResults back to their model by Id and align each model's metrics
+        
+        Args:
+            model_ids: List of model IDs that were fetched
+            metrics: List of (key, metric_name, stat) tuples that were fetched
+            query_targets: Query targets from _build_metric_requests
+            results: MetricDataResults from every request, in request order
+            period: Granularity in seconds
+        
+        Returns:
+            Dict mapping model_id to dataset {'timestamps', 'data', 'period'}
+        """
+        all_data_with_timestamps = {
+            model_id: {key: {'timestamps': [], 'values': []} for key, _, _ in metrics}
+            for model_id in model_ids
+        }
+        
+        for result in results:
+            model_id, (key, _, _) = query_targets[int(result['Id'][1:])]
+            if result['Values'] and result['Timestamps']:
+                all_data_with_timestamps[model_id][key]['values'].extend(result['Values'])
+                all_data_with_timestamps[model_id][key]['timestamps'].extend(result['Timestamps'])
+        
+        return {
+            model_id: self._align_metric_data(metric_data, period)
+            for model_id, metric_data in all_data_with_timestamps.items()
+        }
+    
+    def _empty_datasets(self, model_ids, metrics, period):
+        """Return empty datasets for every model, used when a fetch fails"""
+        return {
+            model_id: {
+                'timestamps': np.array([], dtype='datetime64[s]'),
+                'data': {key: np.array([], dtype=np.float64) for key, _, _ in metrics},
                 'period': period
             }
+            for model_id in model_ids
+        }
+    
+    def _align_metric_data(self, all_data_with_timestamps, period):
+        """Align per-metric (timestamps, values) onto one shared timestamp axis
+        
+        Args:
+            all_data_with_timestamps: Dict of metric key -> {'timestamps': [...], 'values': [...]}
+            period: Granularity in seconds
+        
+        Returns:
+            Dataset dict {'timestamps': datetime64[s] array, 'data': {key: float64 array}, 'period'}
+            with NaN for missing points. Timestamps are sorted and unique, and every metric array
+            has the same length, which the searchsorted slicing downstream relies on.
+        """
+        # Align data by timestamps: sort and dedupe the union of every metric's timestamps in one
+        # C-level np.unique over epochs (CloudWatch doesn't guarantee order across multiple chunks),
+        # then scatter each metric onto that axis by position instead of per-timestamp dict lookups
+        metric_items = list(all_data_with_timestamps.items())
+        raw_timestamps = [ts for _, metric_data in metric_items for ts in metric_data['timestamps']]
+        epochs = self._to_datetime64(raw_timestamps)
+        all_timestamps = np.unique(epochs)
+        
+        all_data = {}
+        offset = 0
+        for metric_id, metric_data in metric_items:
+            n_points = len(metric_data['timestamps'])
+            aligned = np.full(len(all_timestamps), np.nan)
+            if n_points:
+                positions = np.searchsorted(all_timestamps, epochs[offset:offset + n_points])
+                aligned[positions] = np.asarray(metric_data['values'], dtype=np.float64)
+            offset += n_points
+            all_data[metric_id] = aligned
+        
+        return {
+            'timestamps': all_timestamps,
+            'data': all_data,
+            'period': period
+        }
     
     def slice_and_process_data(self, fetched_data, time_period, granularity_config):
         """
@@ -633,7 +505,7 @@ class CloudWatchMetricsFetcher:
         
         # Get token metrics from 1-min data
         if '60_token' not in fetched_data:
-            logger.info(f"    Warning: No 1-min token data for {time_period}")
+            self.log.info(f"    Warning: No 1-min token data for {time_period}")
             return self._empty_time_series(time_period)
         
         token_dataset = fetched_data['60_token']
@@ -661,34 +533,21 @@ class CloudWatchMetricsFetcher:
         token_timestamps = token_dataset['timestamps']
         token_data = token_dataset['data']
         
-        # Find indices within time range
-        token_indices = [i for i, ts in enumerate(token_timestamps) if start_time <= ts <= end_time]
+        # Every metric array shares the dataset's timestamp axis, so one range slices them all
+        token_in_range = self._time_range_slice(token_timestamps, start_time, end_time)
         
-        if not token_indices:
+        if token_in_range.start == token_in_range.stop:
             return self._empty_time_series(time_period)
         
-        filtered_token_timestamps = [token_timestamps[i] for i in token_indices]
-        filtered_token_data = {}
-        for key in ['invocations', 'input_tokens', 'output_tokens']:
-            if key in token_data and token_data[key]:
-                valid_indices = [i for i in token_indices if i < len(token_data[key])]
-                filtered_token_data[key] = [token_data[key][i] for i in valid_indices]
-            else:
-                filtered_token_data[key] = []
+        filtered_token_timestamps = token_timestamps[token_in_range]
+        filtered_token_data = {key: values[token_in_range] for key, values in token_data.items()}
         
         # Slice other metrics if available
-        filtered_other_data = {}
         if other_dataset:
             other_timestamps = other_dataset['timestamps']
             other_data = other_dataset['data']
-            other_indices = [i for i, ts in enumerate(other_timestamps) if start_time <= ts <= end_time]
-            
-            for key in ['throttles', 'client_errors', 'server_errors', 'latency']:
-                if key in other_data and other_data[key]:
-                    valid_indices = [i for i in other_indices if i < len(other_data[key])]
-                    filtered_other_data[key] = [other_data[key][i] for i in valid_indices]
-                else:
-                    filtered_other_data[key] = []
+            other_in_range = self._time_range_slice(other_timestamps, start_time, end_time)
+            filtered_other_data = {key: values[other_in_range] for key, values in other_data.items()}
         else:
             # No other metrics available
             filtered_other_data = {
@@ -713,46 +572,43 @@ class CloudWatchMetricsFetcher:
         """Aggregate fine-grained data to coarser granularity using peak (max) values
         
         Args:
-            timestamps: List of datetime objects
-            values: List of values (TPM or RPM)
+            timestamps: Sorted datetime64[s] array
+            values: Array of values (TPM or RPM)
             source_period: Source period in seconds (e.g., 60 for 1-min)
             target_period: Target period in seconds (e.g., 300 for 5-min, 3600 for 1-hour)
             
         Returns:
             Tuple of (aggregated_timestamps, aggregated_values) where each value is the peak within the window
         """
-        if not timestamps or not values:
+        if len(timestamps) == 0 or len(values) == 0:
             return timestamps, values
         
-        # Group data points by target period windows
-        from collections import defaultdict
-        windows = defaultdict(list)
+        # Floor each timestamp to its window start (same boundaries as _align_to_period_boundary,
+        # which caps alignment at the top of the hour)
+        window_seconds = min(target_period, 3600)
+        epochs = timestamps.astype('datetime64[s]').astype(np.int64)
+        window_starts = epochs - epochs % window_seconds
         
-        for ts, val in zip(timestamps, values):
-            # Align timestamp to target period boundary
-            window_start = self._align_to_period_boundary(ts, target_period)
-            windows[window_start].append(val)
+        # Timestamps are sorted, so each window is a contiguous run: take the max per run
+        aggregated_starts, run_starts = np.unique(window_starts, return_index=True)
+        aggregated_values = np.maximum.reduceat(values, run_starts)
         
-        # Calculate peak for each window
-        aggregated_timestamps = sorted(windows.keys())
-        aggregated_values = [max(windows[ts]) for ts in aggregated_timestamps]
-        
-        return aggregated_timestamps, aggregated_values
+        return aggregated_starts.astype('datetime64[s]'), aggregated_values
     
     def _slice_from_dataset(self, dataset, start_time, end_time, time_period):
         """Slice data from a single dataset by time range
         
         Dataset structure:
         {
-            'timestamps': [datetime, datetime, ...],
+            'timestamps': datetime64[s] array,
             'data': {
-                'invocations': [value, value, ...],
-                'input_tokens': [value, value, ...],
-                'output_tokens': [value, value, ...],
-                'throttles': [value, value, ...],
-                'client_errors': [value, value, ...],
-                'server_errors': [value, value, ...],
-                'latency': [value, value, ...]
+                'invocations': float64 array,
+                'input_tokens': float64 array,
+                'output_tokens': float64 array,
+                'throttles': float64 array,
+                'client_errors': float64 array,
+                'server_errors': float64 array,
+                'latency': float64 array
             },
             'period': 60|300|3600  # granularity in seconds
         }
@@ -762,26 +618,33 @@ class CloudWatchMetricsFetcher:
         period = dataset['period']
         
         # Find timestamps that fall within the requested time range
-        indices = [i for i, ts in enumerate(timestamps) if start_time <= ts <= end_time]
+        in_range = self._time_range_slice(timestamps, start_time, end_time)
         
         # If empty
-        if not indices:
+        if in_range.start == in_range.stop:
             return self._empty_time_series(time_period)
         
-        filtered_timestamps = [timestamps[i] for i in indices]
-        filtered_data = {}
-        
-        # Safely filter data arrays, ensuring indices are within bounds
-        for key in data:
-            if data[key]:
-                # Only use indices that are valid for this data array
-                valid_indices = [i for i in indices if i < len(data[key])]
-                filtered_data[key] = [data[key][i] for i in valid_indices]
-            else:
-                filtered_data[key] = []
+        filtered_timestamps = timestamps[in_range]
+        filtered_data = {key: values[in_range] for key, values in data.items()}
         
         return self._process_combined_time_series(filtered_data, filtered_timestamps, period, time_period)
     
+    def _time_range_slice(self, timestamps, start_time, end_time):
+        """Locate the inclusive [start_time, end_time] range in sorted timestamps
+        
+        Args:
+            timestamps: Sorted datetime64[s] array
+            start_time: Start of time range
+            end_time: End of time range
+        
+        Returns:
+            slice selecting the range; indexing with it returns views, not copies
+        """
+        range_start, range_end = self._to_datetime64([start_time, end_time])
+        lo = int(np.searchsorted(timestamps, range_start, side='left'))
+        hi = int(np.searchsorted(timestamps, range_end, side='right'))
+        return slice(lo, max(lo, hi))
+    
     def _chunk_time_range(self, start_time, end_time, period):
         """Split time range into chunks to respect CloudWatch data point limit
         
@@ -805,7 +668,8 @@ class CloudWatchMetricsFetcher:
         
         return chunks
     
-    def _initialize_metrics(self, time_period):
+    @staticmethod
+    def _initialize_metrics(time_period):
         """Initialize metrics with empty defaults (no fake data points)"""
         metrics = {
             'Invocations': {'values': [], 'p50': 0.0, 'p90': 0.0, 'count': 0, 'sum': 0.0, 'avg': 0.0},
@@ -842,97 +706,128 @@ class CloudWatchMetricsFetcher:
     
     def _empty_time_series(self, time_period):
         """Return empty time series data"""
-        metrics = {
-            'RPM': {'timestamps': [], 'values': []},
-            'TPM': {'timestamps': [], 'values': []},
-            'InvocationThrottles': {'timestamps': [], 'values': []}
-        }
+        metric_names = ['RPM', 'TPM', 'InvocationThrottles']
         if time_period != "1hour":
-            metrics['TPD'] = {'timestamps': [], 'values': []}
-        return metrics
+            metric_names.append('TPD')
+        return {metric_name: self._empty_series() for metric_name in metric_names}
+    
+    def _empty_series(self):
+        """Return a single empty {'timestamps', 'values'} series"""
+        return {
+            'timestamps': np.array([], dtype='datetime64[s]'),
+            'values': np.array([], dtype=np.float64)
+        }
     
     def _fill_missing_timestamps(self, timestamps, values, period):
-        """Fill missing timestamps with null values to create gaps in charts
+        """Fill missing timestamps with NaN values to create gaps in charts
         
         Args:
-            timestamps: List of ISO timestamp strings (already sorted)
-            values: List of values corresponding to timestamps
+            timestamps: Sorted datetime64[s] array
+            values: Float array of values corresponding to timestamps
             period: Granularity period in seconds (60, 300, 3600)
         
         Returns:
-            tuple: (filled_timestamps, filled_values) with nulls for missing data points
+            tuple: (filled_timestamps, filled_values) with NaN for missing data points
         """
-        if not timestamps or not values:
+        if len(timestamps) == 0 or len(values) == 0:
             return timestamps, values
         
-        # Convert ISO strings to datetime objects
-        dt_timestamps = [datetime.fromisoformat(ts.replace('Z', '+00:00')) for ts in timestamps]
+        grid, positions = self._grid_positions(timestamps, period)
+        return grid, self._scatter_to_grid(grid, positions, values)
+    
+    def _grid_positions(self, timestamps, period):
+        """Build the complete period grid spanning timestamps and locate each timestamp on it
         
-        # Generate complete sequence from first to last timestamp
-        start_time = dt_timestamps[0]
-        end_time = dt_timestamps[-1]
+        Args:
+            timestamps: Sorted, non-empty datetime64[s] array
+            period: Grid spacing in seconds
+        
+        Returns:
+            tuple: (grid, positions) where positions[i] is the grid slot of timestamps[i],
+            or -1 if it doesn't land exactly on the grid
+        """
+        # Complete sequence from first to last timestamp (inclusive) at period intervals
+        grid = np.arange(timestamps[0], timestamps[-1] + np.timedelta64(1, 's'), np.timedelta64(period, 's'))
+        positions = np.searchsorted(grid, timestamps)
+        on_grid = grid[np.minimum(positions, len(grid) - 1)] == timestamps
+        return grid, np.where(on_grid, positions, -1)
+    
+    def _scatter_to_grid(self, grid, positions, values):
+        """Place values at their grid slots, leaving NaN where no data point exists
         
-        filled_timestamps = []
-        filled_values = []
+        Args:
+            grid: Grid from _grid_positions
+            positions: Slot positions from _grid_positions
+            values: Float array aligned with the timestamps used to build positions
         
-        # Create a map of existing timestamps to values for quick lookup
-        timestamp_map = {dt: val for dt, val in zip(dt_timestamps, values)}
+        Returns:
+            Float array of len(grid)
+        """
+        filled_values = np.full(len(grid), np.nan)
+        n = min(len(positions), len(values))
+        on_grid = positions[:n] >= 0
+        filled_values[positions[:n][on_grid]] = values[:n][on_grid]
+        return filled_values
+    
+    def _sum_on_common_grid(self, ts_parts, val_parts, period):
+        """Sum several profiles' series on one dense grid spanning all of them
         
-        # Generate expected timestamps at period intervals
-        current_time = start_time
-        while current_time <= end_time:
-            filled_timestamps.append(current_time.isoformat())
-            # Use actual value if exists, otherwise None (becomes null in JSON)
-            filled_values.append(timestamp_map.get(current_time, None))
-            current_time += timedelta(seconds=period)
+        Args:
+            ts_parts: Sorted datetime64[s] arrays, one per profile (at least one non-empty)
+            val_parts: Float arrays aligned with ts_parts, without NaN
+            period: Grid spacing in seconds
         
-        return filled_timestamps, filled_values
+        Returns:
+            tuple: (grid, totals) with NaN where no profile has a data point
+        """
+        first = min(part[0] for part in ts_parts if len(part))
+        last = max(part[-1] for part in ts_parts if len(part))
+        grid = np.arange(first, last + np.timedelta64(1, 's'), np.timedelta64(period, 's'))
+        
+        # One row per profile, so the cross-profile sum is a column-wise reduction
+        stack = np.full((len(ts_parts), len(grid)), np.nan)
+        for row, (timestamps, values) in zip(stack, zip(ts_parts, val_parts)):
+            positions = np.searchsorted(grid, timestamps)
+            on_grid = grid[np.minimum(positions, len(grid) - 1)] == timestamps
+            row[positions[on_grid]] = values[on_grid]
+        
+        missing = np.isnan(stack).all(axis=0)
+        totals = np.nansum(stack, axis=0)
+        totals[missing] = np.nan
+        return grid, totals
     
     def _aggregate_tokens_by_day(self, timestamps, token_values, reference_time):
         """Aggregate token values by day using 24-hour backward windows from reference time
         
         Args:
-            timestamps: List of ISO timestamp strings
-            token_values: List of token counts (raw sums from CloudWatch)
+            timestamps: Sorted datetime64[s] array
+            token_values: Array of token counts (raw sums from CloudWatch)
             reference_time: datetime object to use as reference for window boundaries
         
         Returns:
-            tuple: (daily_timestamps, daily_totals) where each entry represents one 24-hour window
+            tuple: (daily_timestamps, daily_totals) arrays where each entry represents one 24-hour window
         """
         
-        if not timestamps or not token_values:
-            return [], []
+        if len(timestamps) == 0 or len(token_values) == 0:
+            return self._empty_series()['timestamps'], self._empty_series()['values']
         
         # Use reference time for consistent window boundaries across all profiles
-        now = reference_time
-        
-        # Create 24-hour windows going backward from now
-        # Determine how many days we need based on the oldest timestamp
-        oldest_ts = datetime.fromisoformat(timestamps[0].replace('Z', '+00:00'))
-        days_needed = int((now - oldest_ts).total_seconds() / 86400) + 1
-        
-        # Create windows: each window is [window_start, window_end)
-        windows = []
-        for day_offset in range(days_needed):
-            window_end = now - timedelta(days=day_offset)
-            window_start = window_end - timedelta(days=1)
-            windows.append((window_start, window_end))
-        
-        # Aggregate tokens into windows
-        window_totals = defaultdict(int)
-        for ts_str, tokens in zip(timestamps, token_values):
-            ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-            # Find which window this timestamp belongs to
-            for window_start, window_end in windows:
-                if window_start <= ts < window_end:
-                    window_totals[(window_start, window_end)] += tokens
-                    break
-        
-        # Sort windows by start time and create output lists
-        # Only include windows with data (sparse output for individual profiles)
-        sorted_windows = sorted(window_totals.keys(), key=lambda w: w[0])
-        daily_timestamps = [window_start.isoformat() for window_start, _ in sorted_windows]
-        daily_totals = [window_totals[window] for window in sorted_windows]
+        now = np.datetime64(int(reference_time.timestamp()), 's')
+        
+        # Windows are [now - (k+1) days, now - k days), so a point d seconds before now
+        # (d > 0) belongs to window k = (d - 1) // 86400. Bucket every point at once
+        # instead of probing windows one by one.
+        seconds_before = (now - timestamps).astype(np.int64)
+        in_window = seconds_before > 0
+        window_index = (seconds_before[in_window] - 1) // 86400
+        
+        window_totals = np.bincount(window_index, weights=token_values[in_window])
+        window_counts = np.bincount(window_index)
+        
+        # Only include windows with data (sparse output for individual profiles), oldest first
+        windows_with_data = np.flatnonzero(window_counts)[::-1]
+        daily_timestamps = now - (windows_with_data + 1) * np.timedelta64(86400, 's')
+        daily_totals = window_totals[windows_with_data]
         
         return daily_timestamps, daily_totals
     
@@ -943,20 +838,33 @@ class CloudWatchMetricsFetcher:
         
         aggregated = self._initialize_metrics(time_period)
         
+        if len(all_stats) == 1:
+            # A single profile's statistics already are the aggregate: reuse them instead of recomputing
+            profile_stats = next(iter(all_stats.values()))
+            for metric_name in aggregated:
+                if metric_name in profile_stats and len(profile_stats[metric_name]['values']):
+                    aggregated[metric_name] = profile_stats[metric_name]
+            return aggregated
+        
         for metric_name in aggregated.keys():
-            all_values = []
-            for profile_stats in all_stats.values():
-                if metric_name in profile_stats and profile_stats[metric_name]['values']:
-                    all_values.extend(profile_stats[metric_name]['values'])
-            
-            if all_values:
+            # Profile values are already arrays: join them once instead of extending a Python list
+            value_arrays = [
+                profile_stats[metric_name]['values'] for profile_stats in all_stats.values()
+                if metric_name in profile_stats and len(profile_stats[metric_name]['values'])
+            ]
+            
+            if value_arrays:
+                all_values = np.concatenate(value_arrays)
+                # Both percentiles from a single partition of the data
+                p50, p90 = np.percentile(all_values, [50, 90])
+                total = all_values.sum()
                 aggregated[metric_name] = {
                     'values': all_values,
-                    'p50': np.percentile(all_values, 50),
-                    'p90': np.percentile(all_values, 90),
-                    'count': len(all_values),
-                    'sum': sum(all_values),
-                    'avg': np.mean(all_values)
+                    'p50': p50,
+                    'p90': p90,
+                    'count': all_values.size,
+                    'sum': total,
+                    'avg': total / all_values.size
                 }
         
         return aggregated
@@ -966,7 +874,7 @@ class CloudWatchMetricsFetcher:
         if not all_ts:
             return {}
         
-        logger.info(f"    Aggregating time series for {len(all_ts)} profiles...")
+        self.log.info(f"    Aggregating time series for {len(all_ts)} profiles...")
         
         # Determine period for filling based on time_period
         period_map = {'1hour': 60, '1day': 300, '7days': 3600, '14days': 3600, '30days': 3600}
@@ -975,76 +883,62 @@ class CloudWatchMetricsFetcher:
         aggregated = {}
         
         for metric_name in ['TPM', 'RPM', 'InvocationThrottles']:
-            # Collect only timestamps with non-None values from all profiles
-            values_by_ts = {}
-            
+            # Collect only timestamps with non-missing values from all profiles
+            ts_parts = []
+            val_parts = []
             for profile_ts in all_ts.values():
                 if metric_name in profile_ts:
-                    ts_list = profile_ts[metric_name]['timestamps']
-                    val_list = profile_ts[metric_name]['values']
-                    for ts, val in zip(ts_list, val_list):
-                        if val is not None:  # Only collect non-None values
-                            if ts not in values_by_ts:
-                                values_by_ts[ts] = 0
-                            values_by_ts[ts] += val
-            
-            if values_by_ts:
-                # Sort timestamps and get values
-                sorted_timestamps = sorted(values_by_ts.keys())
-                sorted_values = [values_by_ts[ts] for ts in sorted_timestamps]
-                
-                # Fill missing timestamps to create gaps in chart
-                filled_ts, filled_vals = self._fill_missing_timestamps(sorted_timestamps, sorted_values, fill_period)
+                    val_arr = profile_ts[metric_name]['values']
+                    present = ~np.isnan(val_arr)
+                    ts_parts.append(profile_ts[metric_name]['timestamps'][present])
+                    val_parts.append(val_arr[present])
+            
+            if any(len(part) for part in ts_parts):
+                if len(ts_parts) == 1:
+                    # A single profile's series is already sorted and unique: only the gaps need filling
+                    filled_ts, filled_vals = self._fill_missing_timestamps(ts_parts[0], val_parts[0], fill_period)
+                else:
+                    filled_ts, filled_vals = self._sum_on_common_grid(ts_parts, val_parts, fill_period)
                 
                 aggregated[metric_name] = {
                     'timestamps': filled_ts,
                     'values': filled_vals
                 }
             else:
-                aggregated[metric_name] = {
-                    'timestamps': [],
-                    'values': []
-                }
+                aggregated[metric_name] = self._empty_series()
         
         # Aggregate TPD separately using only TPD timestamps (daily granularity)
         if time_period != "1hour":
-            tpd_timestamps = set()
+            tpd_ts_parts = []
+            tpd_val_parts = []
             for profile_ts in all_ts.values():
-                if 'TPD' in profile_ts and profile_ts['TPD']['timestamps']:
-                    tpd_timestamps.update(profile_ts['TPD']['timestamps'])
-            
-            if tpd_timestamps:
-                sorted_tpd_timestamps = sorted(tpd_timestamps)
-                tpd_values_by_ts = {ts: 0 for ts in sorted_tpd_timestamps}
-                
-                for profile_ts in all_ts.values():
-                    if 'TPD' in profile_ts:
-                        ts_list = profile_ts['TPD']['timestamps']
-                        val_list = profile_ts['TPD']['values']
-                        for ts, val in zip(ts_list, val_list):
-                            tpd_values_by_ts[ts] += val
+                if 'TPD' in profile_ts:
+                    tpd_ts_parts.append(profile_ts['TPD']['timestamps'])
+                    tpd_val_parts.append(profile_ts['TPD']['values'])
+            
+            if any(len(part) for part in tpd_ts_parts):
+                if len(tpd_ts_parts) == 1:
+                    # A single profile's windows are already sorted and unique
+                    unique_ts, inverse = tpd_ts_parts[0], np.arange(len(tpd_ts_parts[0]))
+                else:
+                    # Union of every profile's window starts in one C-level sort + dedupe
+                    unique_ts, inverse = np.unique(np.concatenate(tpd_ts_parts), return_inverse=True)
                 
                 # Fill in missing days with 0s for aggregated TPD (dense timeline)
                 # This ensures continuous timeline even when no profiles had data for certain days
-                if sorted_tpd_timestamps:
-                    first_ts = datetime.fromisoformat(sorted_tpd_timestamps[0].replace('Z', '+00:00'))
-                    last_ts = datetime.fromisoformat(sorted_tpd_timestamps[-1].replace('Z', '+00:00'))
-                    
-                    # Generate all daily timestamps from first to last
-                    complete_timestamps = []
-                    current = first_ts
-                    while current <= last_ts:
-                        ts_str = current.isoformat()
-                        complete_timestamps.append(ts_str)
-                        if ts_str not in tpd_values_by_ts:
-                            tpd_values_by_ts[ts_str] = 0
-                        current += timedelta(days=1)
-                    
-                    aggregated['TPD'] = {
-                        'timestamps': complete_timestamps,
-                        'values': [tpd_values_by_ts[ts] for ts in complete_timestamps]
-                    }
+                daily_grid, grid_positions = self._grid_positions(unique_ts, 86400)
+                point_positions = grid_positions[inverse]
+                on_grid = point_positions >= 0
+                # Same sequential per-slot sum as np.add.at, through bincount's faster buffered loop
+                daily_totals = np.bincount(
+                    point_positions[on_grid],
+                    weights=np.concatenate(tpd_val_parts)[on_grid],
+                    minlength=len(daily_grid)
+                )
+                
+                aggregated['TPD'] = {
+                    'timestamps': daily_grid,
+                    'values': daily_totals
+                }
         
         return aggregated
-
-
@@ -4,8 +4,10 @@
 """Inference profile discovery for Bedrock models"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from bedrock_usage_analyzer.aws.bedrock import get_default_region_prefix_map
+from bedrock_usage_analyzer.aws.bedrock import get_default_region_prefix_map, get_single_region_prefix
+from bedrock_usage_analyzer.aws.clients import get_max_workers, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -46,68 +48,65 @@ class InferenceProfileFetcher:
                 logger.info(f"No application profiles found (API not available)")
                 return profiles, profile_names, profile_metadata
 
-            response = self.bedrock_client.list_inference_profiles(
-                maxResults=1000,
-                typeEquals='APPLICATION'
-            )
-            
-            pagination_count = 1
-            
-            # Handle pagination and cache all profiles
-            while True:
-                self._all_profiles_cache.extend(response['inferenceProfileSummaries'])
-                
-                if 'nextToken' in response:
-                    pagination_count += 1
-                    logger.info(f"    Fetching page {pagination_count}...")
-                    response = self.bedrock_client.list_inference_profiles(
-                        maxResults=1000,
-                        typeEquals='APPLICATION',
-                        nextToken=response['nextToken']
-                    )
-                else:
-                    break
+            self._all_profiles_cache = list(paginate(
+                self.bedrock_client, 'list_inference_profiles', 'inferenceProfileSummaries',
+                typeEquals='APPLICATION', PaginationConfig={'PageSize': 1000}
+            ))
             
             logger.info(f"  Cached {len(self._all_profiles_cache)} application profiles")
         else:
             logger.info(f"  Using cached profiles ({len(self._all_profiles_cache)} profiles)")
         
-        matched_profiles = 0
-        
         # Search cached profiles
+        matched = []
         for profile in self._all_profiles_cache:
             model_arns = [m['modelArn'] for m in profile['models']]
-            source = self._infer_source_profile(model_arns)
+            source = self._infer_source_profile(model_arns, model_id)
             
             if source == target_endpoint:
-                matched_profiles += 1
                 profile_id = profile['inferenceProfileId']
                 profiles.append(profile_id)
                 profile_names[profile_id] = profile.get('inferenceProfileName', profile_id)
-                
-                # Get inferenceProfileId directly from response
-                inference_profile_id = profile.get('inferenceProfileId', 'N/A')
-                
-                # Fetch tags via list_tags_for_resource API
-                tags = {}
-                profile_arn = profile.get('inferenceProfileArn')
-                if profile_arn:
-                    try:
-                        tags_response = self.bedrock_client.list_tags_for_resource(resourceARN=profile_arn)
-                        # Convert list of {key, value} dicts to simple dict
-                        tags = {tag['key']: tag['value'] for tag in tags_response.get('tags', [])}
-                    except Exception as e:
-                        logger.info(f"  Warning: Could not fetch tags for {profile_id}: {e}")
-                    profile_metadata[profile_id] = {
-                        'id': inference_profile_id,
-                        'tags': tags
-                    }
+                matched.append(profile)
+        matched_profiles = len(matched)
+        
+        # Fetch tags via list_tags_for_resource API concurrently (one independent call per profile)
+        tagged = [profile for profile in matched if profile.get('inferenceProfileArn')]
+        if tagged:
+            with ThreadPoolExecutor(max_workers=min(get_max_workers(), len(tagged))) as executor:
+                all_tags = list(executor.map(self._fetch_profile_tags, tagged))
+            
+            for profile, tags in zip(tagged, all_tags):
+                profile_metadata[profile['inferenceProfileId']] = {
+                    # Get inferenceProfileId directly from response
+                    'id': profile.get('inferenceProfileId', 'N/A'),
+                    'tags': tags
+                }
         
         logger.info(f"  Profile discovery: {matched_profiles} application profiles matched")
         return profiles, profile_names, profile_metadata
     
-    def _infer_source_profile(self, model_arns):
-        """Infer which endpoint an application profile is based on"""
+    def _fetch_profile_tags(self, profile):
+        """Fetch tags for an application profile as a simple dict (empty on failure)"""
+        try:
+            tags_response = self.bedrock_client.list_tags_for_resource(resourceARN=profile['inferenceProfileArn'])
+            # Convert list of {key, value} dicts to simple dict
+            return {tag['key']: tag['value'] for tag in tags_response.get('tags', [])}
+        except Exception as e:
+            logger.info(f"  Warning: Could not fetch tags for {profile['inferenceProfileId']}: {e}")
+            return {}
+    
+    def _infer_source_profile(self, model_arns, target_model_id=None):
+        """Infer which endpoint an application profile is based on
+        
+        Args:
+            model_arns: Model ARNs of the application profile
+            target_model_id: If given, return None early for profiles of any other model
+        """
+        # Cheap substring reject before parsing ARNs (most profiles are for other models)
+        if target_model_id is not None and target_model_id not in model_arns[0]:
+            return None
+        
         # Extract model ID from first ARN (all ARNs have same model)
         model_id = model_arns[0].split('/')[-1]
         
@@ -116,12 +115,10 @@ class InferenceProfileFetcher:
             return model_id
         
         # System profile: multiple model ARNs across regions
-        regions = [arn.split(':')[3] for arn in model_arns]
-        region_prefixes = set(r.split('-')[0] for r in regions)
+        region_prefix = get_single_region_prefix(model_arns)
         
-        if len(region_prefixes) == 1:
+        if region_prefix is not None:
             # Single region prefix (us, eu, ap, ca, jp, au)
-            region_prefix = list(region_prefixes)[0]
             system_prefix = self.prefix_map.get(region_prefix, region_prefix)
             return f"{system_prefix}.{model_id}"
         else:
@@ -4,6 +4,7 @@
 """User input collection for Bedrock usage analysis"""
 
 import os
+import re
 import sys
 import logging
 import boto3
@@ -14,6 +15,9 @@ from ..utils.paths import get_data_path
 
 logger = logging.getLogger(__name__)
 
+# AWS regions are alphanumeric with hyphens
+_REGION_RE = re.compile(r'\A[A-Za-z0-9-]+\Z')
+
 
 class UserInputs:
     """Handles interactive user input collection"""
@@ -22,6 +26,7 @@ class UserInputs:
         self.account = None
         self.region = None
         self.models = []
+        self._fm_list_cache = {}  # Parsed FM lists by region
         self.granularity_config = {  # The aggregation granularity for different metrics window/period
             '1hour': 300,   # 5 minutes
             '1day': 300,    # 5 minutes
@@ -267,6 +272,9 @@ class UserInputs:
             ('30 DAYS', '30days', [('1 minute', 60), ('5 minutes', 300), ('1 hour', 3600)])
         ]
         
+        # Labels are the same for a given granularity across periods, so index them once
+        granularity_labels = {seconds: label for _, _, options in periods for label, seconds in options}
+        
         for period_name, period_key, options in periods:
             selected_seconds = self._select_granularity(
                 period_name, options, min_granularity, 
@@ -277,7 +285,7 @@ class UserInputs:
             # Update tracking for next iteration
             min_granularity = max(min_granularity, selected_seconds)
             prev_period_name = period_name
-            prev_granularity_label = next(label for label, sec in options if sec == selected_seconds)
+            prev_granularity_label = granularity_labels[selected_seconds]
         
         logger.info("\n" + "="*60)
         logger.info("Granularity configuration complete!")
@@ -299,6 +307,7 @@ class UserInputs:
             else:
                 logger.info(f"  {i}. {label}")
                 available_options.append(i)
+        available_options = frozenset(available_options)
         
         # Get valid choice
         while True:
@@ -335,8 +344,8 @@ class UserInputs:
     
     def _ensure_fm_list(self, region):
         """Ensure FM list exists for region"""
-        # Validate region format (AWS regions are alphanumeric with hyphens)
-        if not region or not all(c.isalnum() or c == '-' for c in region):
+        # Validate region format (also rejects empty strings)
+        if not region or not _REGION_RE.match(region):
             raise ValueError(f"Invalid region format: {region}")
         
         try:
@@ -347,11 +356,13 @@ class UserInputs:
             sys.exit(1)
     
     def _load_fm_list(self, region):
-        """Load foundation models for region"""
-        fm_file = get_data_path(f'fm-list-{region}.yml')
-        
-        data = load_yaml(fm_file)
-        return data.get('models', [])
+        """Load foundation models for region (parsed once per region)"""
+        if region not in self._fm_list_cache:
+            fm_file = get_data_path(f'fm-list-{region}.yml')
+            
+            data = load_yaml(fm_file)
+            self._fm_list_cache[region] = data.get('models', [])
+        return self._fm_list_cache[region]
     
     def select_output_dir(self) -> str:
         """Prompt user to select output directory for results."""
@@ -5,10 +5,12 @@
 
 import os
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 from bedrock_usage_analyzer.utils.yaml_handler import load_yaml, save_yaml
 from bedrock_usage_analyzer.utils.paths import get_writable_path, get_bundle_path, get_data_path
+from bedrock_usage_analyzer.aws.clients import get_max_workers
 from bedrock_usage_analyzer.aws.bedrock import (
     fetch_foundation_models,
     fetch_all_inference_profiles,
@@ -50,7 +52,22 @@ def save_models(filepath: str, models: List[Dict]):
     save_yaml(filepath, {'models': sorted_models})
 
 
-def refresh_region(region: str, update_bundle: bool = False):
+def fetch_region_data(region: str) -> Tuple[List[Dict], Optional[List[Dict]]]:
+    """Fetch the AWS data a region refresh needs (its network-bound part)
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        Tuple of (all inference profiles, foundation models or None if access denied)
+    """
+    # ALL inference profiles are fetched once; used for both prefix discovery and the profile map
+    all_profiles = fetch_all_inference_profiles(region)
+    models = fetch_foundation_models(region)
+    return all_profiles, models
+
+
+def refresh_region(region: str, update_bundle: bool = False, region_data: Optional[Tuple] = None):
     """Refresh foundation models for a region
     
     Also refreshes prefix mapping, merging with existing prefixes.
@@ -58,12 +75,21 @@ def refresh_region(region: str, update_bundle: bool = False):
     Args:
         region: AWS region name
         update_bundle: Also update bundled metadata (for maintainers)
+        region_data: Result of fetch_region_data for this region, fetched here if not provided
+        
+    Returns:
+        bool: False if the region was skipped because its foundation models couldn't be fetched
     """
     logger.info(f"\nProcessing region: {region}")
     
+    if region_data is None:
+        logger.info(f"  Fetching inference profiles and foundation models...")
+        region_data = fetch_region_data(region)
+    all_profiles, models = region_data
+    
     # Refresh prefix mapping - merge with existing
     logger.info("  Refreshing prefix mapping...")
-    discovered = discover_prefix_mapping(region)
+    discovered = discover_prefix_mapping(region, all_profiles)
     
     # Load existing prefixes if file exists
     existing_prefixes = {}
@@ -118,17 +144,13 @@ def refresh_region(region: str, update_bundle: bool = False):
     
     output_file = get_writable_path(f'fm-list-{region}.yml')
     
-    # Fetch foundation models
-    models = fetch_foundation_models(region)
     if models is None:
-        return
+        logger.info(f"  ⊘ Skipping {region} (foundation models could not be fetched)")
+        return False
     
     # Load existing models to preserve quota mappings
     existing_models = load_existing_models(output_file)
     
-    # Fetch ALL inference profiles once
-    logger.info(f"  Fetching inference profiles...")
-    all_profiles = fetch_all_inference_profiles(region)
     # Build mapping from model to inference profiles
     profile_map = build_profile_map(all_profiles)
     logger.info(f"  Found {len(profile_map)} models with inference profiles")
@@ -188,6 +210,8 @@ def refresh_region(region: str, update_bundle: bool = False):
             bundle_file = bundle_path / f'fm-list-{region}.yml'
             save_yaml(str(bundle_file), models_data)
             logger.info(f"  ✓ Saved: {bundle_file} (bundled)")
+    
+    return True
 
 
 def refresh_all_regions(regions: List[str], update_bundle: bool = False):
@@ -197,5 +221,16 @@ def refresh_all_regions(regions: List[str], update_bundle: bool = False):
         regions: List of AWS region names
         update_bundle: Also update bundled metadata (for maintainers)
     """
-    for region in regions:
-        refresh_region(region, update_bundle=update_bundle)
+    if not regions:
+        return
+    
+    # The per-region API calls run concurrently; merging and saving stay sequential, in region order,
+    # since every region updates the shared prefix-mapping.yml
+    skipped = []
+    with ThreadPoolExecutor(max_workers=min(get_max_workers(), len(regions))) as executor:
+        for region, region_data in zip(regions, executor.map(fetch_region_data, regions)):
+            if not refresh_region(region, update_bundle=update_bundle, region_data=region_data):
+                skipped.append(region)
+    
+    if skipped:
+        logger.info(f"\n⊘ Skipped {len(skipped)} region(s) whose foundation models could not be fetched: {', '.join(skipped)}")
@@ -6,6 +6,7 @@
 import logging
 import copy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from bedrock_usage_analyzer.utils.yaml_handler import load_yaml, save_yaml
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 class QuotaMapper:
     """Maps foundation models to their service quotas using Bedrock LLM"""
     
+    # Models whose LLM calls run concurrently; bounded to stay within Bedrock's converse rate limits
+    MAX_PARALLEL_LLM_CALLS = 8
+    
     def __init__(self, bedrock_region: str, model_id: str, target_region: Optional[str] = None):
         """Initialize quota mapper
         
@@ -82,43 +86,55 @@ class QuotaMapper:
         logger.info(f"  Mapping quotas for {len(fm_list)} models...")
         
         updated_count = 0
-        for i, fm in enumerate(fm_list, 1):
-            model_id = fm['model_id']
-            logger.info(f"    [{i}/{len(fm_list)}] {model_id}... ", extra={'end': ''})
-            
-            endpoints_to_process = self._get_endpoints_to_process(fm)
-            
-            if not endpoints_to_process:
-                logger.info("⊘ (no endpoints)")
-                continue
-            
-            # Call LLM
-            # For a given model get the common/base name, so that the keyword search later is not too specific to cause false negative, and not too broad to cost much tokens
-            common_name = self._get_common_name(model_id)
-            if not common_name:
-                logger.info("✗ (no common name)")
-                continue
-            
-            endpoints_data = {}
-            for endpoint_type in endpoints_to_process:
-                # Get the mapping between the current FM with the matching quotas for its RPM, TPM, TPD, concurrent invocations (if available)
-                quota_mapping = self._get_quota_mapping(
-                    region, model_id, common_name, endpoint_type, quotas
-                )
-                if quota_mapping:
-                    endpoints_data[endpoint_type] = {'quotas': quota_mapping}
-            
-            if endpoints_data:
-                fm['endpoints'] = endpoints_data
-                updated_count += 1
-                endpoint_summary = ', '.join(endpoints_data.keys())
-                logger.info(f"✓ ({endpoint_summary})")
-            else:
-                logger.info("✗ (no mappings)")
+        # The LLM round-trips run on worker threads; results are logged and applied in list order
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_LLM_CALLS, len(fm_list))) as executor:
+            results = executor.map(lambda fm: self._map_model(region, fm, quotas), fm_list)
+            for i, (fm, (endpoints_data, skip_reason)) in enumerate(zip(fm_list, results), 1):
+                logger.info(f"    [{i}/{len(fm_list)}] {fm['model_id']}... ", extra={'end': ''})
+                
+                if skip_reason:
+                    logger.info(skip_reason)
+                elif endpoints_data:
+                    fm['endpoints'] = endpoints_data
+                    updated_count += 1
+                    endpoint_summary = ', '.join(endpoints_data.keys())
+                    logger.info(f"✓ ({endpoint_summary})")
+                else:
+                    logger.info("✗ (no mappings)")
         
         self._save_fm_list(region, fm_list)
         logger.info(f"  ✓ Updated {updated_count} models\n")
     
+    def _map_model(self, region: str, fm: Dict, quotas: List[Dict]):
+        """Map each endpoint of one model to its quota codes (LLM calls)
+        
+        Returns:
+            Tuple of (endpoints_data, skip_reason), where skip_reason is the status to log
+            when the model was skipped before any quota mapping
+        """
+        model_id = fm['model_id']
+        endpoints_to_process = self._get_endpoints_to_process(fm)
+        
+        if not endpoints_to_process:
+            return None, "⊘ (no endpoints)"
+        
+        # Call LLM
+        # For a given model get the common/base name, so that the keyword search later is not too specific to cause false negative, and not too broad to cost much tokens
+        common_name = self._get_common_name(model_id)
+        if not common_name:
+            return None, "✗ (no common name)"
+        
+        endpoints_data = {}
+        for endpoint_type in endpoints_to_process:
+            # Get the mapping between the current FM with the matching quotas for its RPM, TPM, TPD, concurrent invocations (if available)
+            quota_mapping = self._get_quota_mapping(
+                region, model_id, common_name, endpoint_type, quotas
+            )
+            if quota_mapping:
+                endpoints_data[endpoint_type] = {'quotas': quota_mapping}
+        
+        return endpoints_data, None
+    
     def _get_endpoints_to_process(self, fm: Dict) -> List[str]:
         """Determine which endpoints to process for a model"""
         # Simply return the keys from the endpoints dict
@@ -5,6 +5,12 @@
 
 import yaml
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 def load_yaml(filepath):
     """Load YAML file with UTF-8 encoding
@@ -16,7 +22,7 @@ def load_yaml(filepath):
         dict: Parsed YAML data
     """
     with open(filepath, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def save_yaml(filepath, data):
@@ -27,4 +33,4 @@ def save_yaml(filepath, data):
         data: Data to save
     """
     with open(filepath, 'w', encoding='utf-8') as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the local common-name shortcut used in quota mapping"""
+
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bedrock_usage_analyzer.aws.bedrock_llm import _try_local_common_name
+
+
+def test_local_common_name_known_families():
+    """Families that appear in quota names are resolved without the LLM"""
+    test_cases = {
+        'anthropic.claude-3-5-sonnet-20241022-v2:0': 'claude',
+        'amazon.nova-lite-v1:0': 'nova',
+        'amazon.titan-text-express-v1': 'titan',
+        'cohere.command-r-plus-v1:0': 'command',
+        'us.anthropic.claude-sonnet-4-20250514-v1:0': 'claude',
+        'global.anthropic.claude-haiku-4-5-20251001-v1:0': 'claude',
+    }
+    for fm_model_id, expected in test_cases.items():
+        assert _try_local_common_name(fm_model_id) == expected, fm_model_id
+
+
+def test_local_common_name_falls_through_to_llm():
+    """Product-line words and families with digits are left to the LLM"""
+    test_cases = [
+        'cohere.embed-english-v3',
+        'cohere.embed-multilingual-v3',
+        'cohere.rerank-v3-5:0',
+        'stability.stable-image-core-v1:1',
+        'stability.sd3-5-large-v1:0',
+        'luma.ray-v2:0',
+        'openai.gpt-oss-120b-1:0',
+        'meta.llama3-2-11b-instruct-v1:0',
+        'us.meta.llama3-2-90b-instruct-v1:0',
+        'qwen.qwen3-32b-v1:0',
+        'x',
+    ]
+    for fm_model_id in test_cases:
+        assert _try_local_common_name(fm_model_id) is None, fm_model_id
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for CloudWatch time series processing"""
+
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bedrock_usage_analyzer.core.metrics_fetcher import CloudWatchMetricsFetcher
+
+
+END_TIME = datetime(2025, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def _minutes(*offsets):
+    """Timestamps at the given minute offsets before END_TIME"""
+    return [END_TIME - timedelta(minutes=m) for m in offsets]
+
+
+def _iso(series):
+    """ISO strings (without offset) for a series' datetime64 timestamps"""
+    return np.datetime_as_string(series['timestamps'], unit='s').tolist()
+
+
+def _all_data(**overrides):
+    data = {
+        'invocations': [], 'input_tokens': [], 'output_tokens': [],
+        'throttles': [], 'client_errors': [], 'server_errors': [], 'latency': []
+    }
+    data.update(overrides)
+    return data
+
+
+def test_tpm_requires_input_and_output():
+    """TPM is only computed where both token counts are present"""
+    fetcher = CloudWatchMetricsFetcher(cloudwatch_client=None)
+
+    # Deliberately unsorted to exercise the reordering
+    timestamps = _minutes(1, 3, 2)
+    all_data = _all_data(
+        input_tokens=[10.0, 30.0, None],
+        output_tokens=[1.0, 3.0, 2.0],
+        invocations=[1.0, 3.0, 2.0]
+    )
+
+    result = fetcher._process_combined_time_series(all_data, timestamps, 60, '1day', 60, END_TIME)
+
+    assert _iso(result['TPM_1min']) == ['2025-01-01T23:57:00', '2025-01-01T23:59:00']
+    np.testing.assert_array_equal(result['TPM_1min']['values'], [33.0, 11.0])
+    # Gap at 23:58 is kept as NaN so charts show a break
+    np.testing.assert_array_equal(result['TPM']['values'], [33.0, np.nan, 11.0])
+    np.testing.assert_array_equal(result['InputTokenCount']['values'], [30.0, np.nan, 10.0])
+    np.testing.assert_array_equal(result['RPM_1min']['values'], [3.0, 2.0, 1.0])
+    assert _iso(result['TPD']) == ['2025-01-01T00:00:00']
+    np.testing.assert_array_equal(result['TPD']['values'], [44.0])
+
+
+def test_peak_aggregation_to_target_period():
+    """Chart series keep the per-window peak when aggregating 1-min data"""
+    fetcher = CloudWatchMetricsFetcher(cloudwatch_client=None)
+
+    timestamps = _minutes(14, 13, 12, 11, 10, 4)
+    all_data = _all_data(invocations=[1.0, 5.0, 2.0, 3.0, 4.0, 7.0])
+
+    result = fetcher._process_combined_time_series(all_data, timestamps, 60, '1hour', 300, END_TIME)
+
+    assert _iso(result['RPM']) == ['2025-01-01T23:45:00', '2025-01-01T23:50:00', '2025-01-01T23:55:00']
+    np.testing.assert_array_equal(result['RPM']['values'], [5.0, 4.0, 7.0])
+    # Per-minute values used for statistics are not aggregated
+    assert len(result['RPM_1min']['values']) == 6
+
+
+def test_empty_input_returns_empty_structure():
+    """No data yields the empty time series skeleton"""
+    fetcher = CloudWatchMetricsFetcher(cloudwatch_client=None)
+
+    result = fetcher._process_combined_time_series(_all_data(), [], 60, '1hour', 60, END_TIME)
+
+    assert sorted(result) == ['InvocationThrottles', 'RPM', 'TPM']
+    assert all(len(series['values']) == 0 for series in result.values())
+
+
+def test_tpd_uses_backward_24h_windows():
+    """TPD windows are anchored on the reference time, not calendar days"""
+    fetcher = CloudWatchMetricsFetcher(cloudwatch_client=None)
+
+    reference = datetime(2025, 1, 3, 12, 30, tzinfo=timezone.utc)
+    timestamps = np.array([
+        '2025-01-01T12:30:00',  # exactly 2 days back: start of the oldest window
+        '2025-01-02T12:29:00',
+        '2025-01-02T12:30:00',  # start of the most recent window
+        '2025-01-03T12:30:00',  # at the reference time: outside every window
+    ], dtype='datetime64[s]')
+    tokens = np.array([1.0, 2.0, 4.0, 8.0])
+
+    daily_ts, daily_totals = fetcher._aggregate_tokens_by_day(timestamps, tokens, reference)
+
+    assert np.datetime_as_string(daily_ts, unit='s').tolist() == ['2025-01-01T12:30:00', '2025-01-02T12:30:00']
+    np.testing.assert_array_equal(daily_totals, [3.0, 4.0])